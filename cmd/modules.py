@@ -59,15 +59,37 @@ Commands:
 - modules health: Check module health status
 """
 
+import functools
+import threading
+from contextlib import contextmanager
+
 import click
-from rich.console import Console
+from pkg.console import console
 from rich.table import Table
 # Panel import removed - not used in current implementation
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # NOTE: module_definitions is now passed via context from main CLI (no global import)
 
-console = Console()
+
+# Cached once at import - piped output (e.g. | grep, CI logs) skips Rich
+# table rendering entirely in favor of plain tab-separated lines.
+_IS_TTY = console.is_terminal
+
+# Memoized accessors for module definition lookups - the underlying data only
+# changes when the backend catalog changes, so repeated calls within one
+# process can reuse the first result instead of re-walking the definitions.
+@functools.lru_cache(maxsize=None)
+def _resource_tiers(module_definitions):
+    return module_definitions.get_resource_tiers()
+
+@functools.lru_cache(maxsize=None)
+def _categories(module_definitions):
+    return module_definitions.get_categories()
+
+@functools.lru_cache(maxsize=None)
+def _resource_template(module_definitions, tier):
+    return module_definitions.get_resource_template(tier)
 
 def _get_module_definitions(ctx):
     """Helper function to get module_definitions from context with error handling"""
@@ -82,30 +104,117 @@ def modules_group():
     """Manage platform modules (enable, disable, configure)"""
     pass
 
+@contextmanager
+def _maybe_progress(description, delay=0.15):
+    """Show a spinner only if the wrapped operation outlives a grace period.
+
+    Fast operations (cache hits, sub-100ms API calls) complete before the
+    timer fires, so no Progress render thread is ever spawned for them.
+    Piped output (json/tsv consumers) never gets a spinner at all —
+    rich would flush frames into the machine-readable stream.
+    """
+    if not _IS_TTY:
+        yield
+        return
+
+    state_lock = threading.Lock()
+    state = {'progress': None, 'done': False}
+
+    def _start_spinner():
+        with state_lock:
+            if state['done']:
+                return
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            )
+            progress.start()
+            progress.add_task(description, total=None)
+            state['progress'] = progress
+
+    timer = threading.Timer(delay, _start_spinner)
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        with state_lock:
+            state['done'] = True
+            if state['progress'] is not None:
+                state['progress'].stop()
+
+def _yaml_safe_load(stream):
+    """safe_load through the libyaml C loader when PyYAML was built with it"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml.load(stream, Loader=loader)
+
+# Parsed --config-file contents keyed by (path, mtime_ns, size) so running
+# enable followed by configure with the same file parses it only once.
+_yaml_file_cache = {}
+
+def _load_yaml_cached(config_file):
+    """Parse a YAML file object, reusing a prior parse if the file is unchanged"""
+    import os
+    import yaml
+
+    try:
+        stat = os.stat(config_file.name)
+        cache_key = (os.path.abspath(config_file.name), stat.st_mtime_ns, stat.st_size)
+    except (OSError, AttributeError):
+        # No stable identity (e.g. stdin) - parse directly
+        return _yaml_safe_load(config_file)
+
+    if cache_key in _yaml_file_cache:
+        return _yaml_file_cache[cache_key]
+
+    parsed = _yaml_safe_load(config_file)
+    _yaml_file_cache[cache_key] = parsed
+    return parsed
+
+def _emit_rows(rows):
+    """Write plain tab-separated rows in one shot (non-TTY / tsv output)"""
+    import sys
+    sys.stdout.write('\n'.join('\t'.join(row) for row in rows) + '\n')
+
 @modules_group.command('list')
+@click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'tsv']),
+              default='table', help='Output format (table auto-degrades to tsv when piped)')
 @click.pass_context
-def list_modules(ctx):
+def list_modules(ctx, output_format):
     """List all available platform modules"""
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Fetching available modules...", total=None)
-            
-            # Get API client from context
-            api_client = ctx.obj.get('api_client')
-            if not api_client:
-                console.print("[red]Error: API client not available. Check configuration.[/red]")
-                return
-                
+        # Get API client from context
+        api_client = ctx.obj.get('api_client')
+        if not api_client:
+            console.print("[red]Error: API client not available. Check configuration.[/red]")
+            return
+
+        with _maybe_progress("Fetching available modules..."):
             modules = api_client.list_modules()
-        
+
         if not modules:
             console.print("📭 [yellow]No modules available[/yellow]")
             return
-        
+
+        if output_format == 'json':
+            import json
+            import sys
+            sys.stdout.write(json.dumps(modules, separators=(',', ':')) + '\n')
+            return
+
+        if output_format == 'tsv' or not _IS_TTY:
+            _emit_rows([(module.get('name', 'Unknown'),
+                         module.get('description', 'No description available'),
+                         module.get('version', 'latest'),
+                         module.get('category', 'general'))
+                        for module in modules])
+            return
+
         table = Table(title="🔧 Available Platform Modules")
         table.add_column("Name", style="cyan", no_wrap=True)
         table.add_column("Description", style="white")
@@ -184,9 +293,8 @@ def enable_module(ctx, module_name, env, config_file):
         
         # Load additional config from file if provided
         if config_file:
-            import yaml
             try:
-                file_config = yaml.safe_load(config_file)
+                file_config = _load_yaml_cached(config_file)
                 module_config.update(file_config)
                 console.print("📋 [dim]Additional configuration loaded from file[/dim]")
             except Exception as e:
@@ -196,12 +304,7 @@ def enable_module(ctx, module_name, env, config_file):
         console.print(f"🏷️  Environment: [green]{env}[/green]")
         console.print(f" Namespace: [cyan]{tenant_name}-{env}[/cyan]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Deploying module with Helm...", total=None)
+        with _maybe_progress("Deploying module with Helm..."):
             result = api_client.enable_module(tenant_name, env, module_name, module_config)
         
         console.print(f"✅ [green]Successfully enabled '{module_name}'![/green]")
@@ -339,15 +442,9 @@ def disable_module(ctx, module_name, env, force, keep_data, complete_cleanup, dr
             console.print("\n💡 [dim]Run without --dry-run to execute cleanup[/dim]")
             return
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task(
-                "Removing module and cleaning up resources..." if cleanup_pvcs or complete_cleanup else "Removing module (keeping data)...", 
-                total=None
-            )
+        with _maybe_progress(
+            "Removing module and cleaning up resources..." if cleanup_pvcs or complete_cleanup else "Removing module (keeping data)..."
+        ):
             result = api_client.disable_module(tenant_name, env, module_name, cleanup_pvcs, cleanup_all)
         
         console.print(f"✅ [green]Successfully disabled '{module_name}'![/green]")
@@ -389,12 +486,7 @@ def module_status(ctx, module_name, env):
         tenant_name = config.get('tenant.name', 'default')
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Checking module status...", total=None)
+        with _maybe_progress("Checking module status..."):
             status = api_client.get_module_deployment_status(tenant_name, module_name, env)
         
         console.print(f"📊 [cyan]Module Status: {module_name}[/cyan]")
@@ -468,8 +560,7 @@ def configure_module(ctx, module_name, env, config_file, scale):
         
         # Load configuration from file if provided
         if config_file:
-            import yaml
-            file_config = yaml.safe_load(config_file)
+            file_config = _load_yaml_cached(config_file)
             updates.update(file_config)
         
         if not updates:
@@ -482,12 +573,7 @@ def configure_module(ctx, module_name, env, config_file, scale):
         for key, value in updates.items():
             console.print(f"   • {key}: {value}")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Updating module configuration...", total=None)
+        with _maybe_progress("Updating module configuration..."):
             result = api_client.update_module_config(tenant_name, env, module_name, updates)
         
         console.print(f"✅ [green]Successfully updated '{module_name}' configuration![/green]")
@@ -516,9 +602,11 @@ def configure_module(ctx, module_name, env, config_file, scale):
               help='Resource tier for quota allocation')
 @click.option('--storage-class', '-s', default='standard', help='Storage class to use')
 @click.option('--output', '-o', type=click.File('w'), help='Output file (default: stdout)')
+@click.option('--output-format', type=click.Choice(['yaml', 'json']), default='yaml',
+              help='Serialization format (json is faster for very large configs)')
 @click.option('--validate-deps', is_flag=True, default=True, help='Validate module dependencies')
 @click.pass_context
-def generate_tenant_config(ctx, namespace, modules, tier, storage_class, output, validate_deps):
+def generate_tenant_config(ctx, namespace, modules, tier, storage_class, output, output_format, validate_deps):
     """Generate tenant configuration with resource quotas and enabled modules"""
     
     try:
@@ -554,7 +642,21 @@ def generate_tenant_config(ctx, namespace, modules, tier, storage_class, output,
             modules=list(modules),
             tier=tier.lower()
         )
-        
+
+        # JSON is valid YAML, so downstream Helm/kubectl tooling accepts it
+        # directly - and serializing deep configs as JSON is much cheaper.
+        if output_format == 'json':
+            import yaml
+            config_data = _yaml_safe_load(yaml_output)
+            try:
+                import orjson
+                yaml_output = orjson.dumps(
+                    config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                ).decode()
+            except ImportError:
+                import json
+                yaml_output = json.dumps(config_data, indent=2, sort_keys=True)
+
         # Output to file or stdout
         if output:
             output.write(yaml_output)
@@ -565,7 +667,7 @@ def generate_tenant_config(ctx, namespace, modules, tier, storage_class, output,
             console.print("="*50)
         
         # Show resource quota summary
-        resource_template = module_definitions.get_resource_template(tier.lower())
+        resource_template = _resource_template(module_definitions, tier.lower())
         if resource_template:
             console.print(f"\n📊 [cyan]Resource Quota Summary ({tier.title()} Tier):[/cyan]")
             quota = resource_template["resource_quota"]
@@ -577,6 +679,98 @@ def generate_tenant_config(ctx, namespace, modules, tier, storage_class, output,
     except Exception as e:
         console.print(f"❌ [red]Error generating configuration: {e}[/red]")
 
+@modules_group.command('apply-config')
+@click.argument('config_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--env', '-e', default=None, help='Environment (dev, staging, prod)')
+@click.option('--concurrency', default=8, show_default=True,
+              help='Maximum number of modules to enable in parallel')
+@click.pass_context
+def apply_tenant_config(ctx, config_path, env, concurrency):
+    """Apply a generated tenant configuration by enabling all its modules"""
+    import asyncio
+    import yaml
+
+    config = ctx.obj['config']
+    api_client = ctx.obj['api_client']
+
+    if env is None:
+        env = config.get('defaults.environment', 'dev')
+    tenant_name = config.get('tenant.name', 'default')
+
+    try:
+        with open(config_path, 'r') as f:
+            tenant_config = _yaml_safe_load(f) or {}
+
+        # Accept both the generated mapping format ({modules: {name: {enabled: ...}}})
+        # and a plain list of module names
+        modules_section = tenant_config.get('modules', tenant_config)
+        if isinstance(modules_section, dict):
+            module_names = [name for name, module_config in modules_section.items()
+                            if not isinstance(module_config, dict) or module_config.get('enabled', True)]
+        else:
+            module_names = [str(name) for name in modules_section]
+
+        if not module_names:
+            console.print("📭 [yellow]No enabled modules found in configuration[/yellow]")
+            return
+
+        console.print(f"🚀 [cyan]Enabling {len(module_names)} modules for tenant '{tenant_name}' ({env})[/cyan]")
+        console.print(f"📦 Modules: [green]{', '.join(module_names)}[/green]")
+
+        # Newer backends take the whole set in one call; older ones 404 on
+        # the bulk endpoint and get the bounded concurrent loop instead
+        try:
+            with _maybe_progress("Deploying modules (single batch)..."):
+                bulk = api_client.bulk_enable_modules(tenant_name, env, module_names)
+            failed = [str(name) for name in bulk.get('failed', [])]
+            for module_name in module_names:
+                if module_name in failed:
+                    console.print(f"❌ [red]{module_name} failed[/red]")
+                else:
+                    console.print(f"✅ [green]{module_name} enabled[/green]")
+            if failed:
+                console.print(f"⚠️ [yellow]{len(failed)}/{len(module_names)} modules failed: {', '.join(failed)}[/yellow]")
+            else:
+                console.print(f"✅ [green]All {len(module_names)} modules enabled successfully![/green]")
+            return
+        except Exception as e:
+            if '404' not in str(e):
+                raise
+
+        async def _apply(names):
+            # Bound concurrency so a large config doesn't overwhelm the backend
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def _enable(name):
+                async with semaphore:
+                    # run_in_executor rather than asyncio.to_thread keeps
+                    # the declared 3.8 floor (to_thread is 3.9+)
+                    return await asyncio.get_running_loop().run_in_executor(
+                        None, api_client.enable_module, tenant_name, env, name, None
+                    )
+
+            return await asyncio.gather(*[_enable(name) for name in names],
+                                        return_exceptions=True)
+
+        with _maybe_progress("Deploying modules concurrently..."):
+            results = asyncio.run(_apply(module_names))
+
+        failed = []
+        for module_name, result in zip(module_names, results):
+            if isinstance(result, Exception):
+                failed.append(module_name)
+                console.print(f"❌ [red]{module_name}: {result}[/red]")
+            else:
+                console.print(f"✅ [green]{module_name} enabled[/green]")
+
+        if failed:
+            console.print(f"⚠️ [yellow]{len(failed)}/{len(module_names)} modules failed: {', '.join(failed)}[/yellow]")
+        else:
+            console.print(f"✅ [green]All {len(module_names)} modules enabled successfully![/green]")
+
+    except Exception as e:
+        console.print(f"❌ [red]Error applying configuration: {e}[/red]")
+
 @modules_group.command('list-tiers')
 @click.pass_context
 def list_resource_tiers(ctx):
@@ -587,12 +781,20 @@ def list_resource_tiers(ctx):
         if not module_definitions:
             return
             
-        resource_tiers = module_definitions.get_resource_tiers()
-        
+        resource_tiers = _resource_tiers(module_definitions)
+
         if not resource_tiers:
             console.print("📭 [yellow]No resource tiers available[/yellow]")
             return
-        
+
+        if not _IS_TTY:
+            _emit_rows([(tier_key,
+                         tier_data.get("cpu", "N/A"),
+                         tier_data.get("memory", "N/A"),
+                         tier_data.get("storage", "N/A"))
+                        for tier_key, tier_data in resource_tiers.items()])
+            return
+
         table = Table(title="💎 Available Resource Tiers")
         table.add_column("Tier", style="cyan", no_wrap=True)
         table.add_column("Name", style="white")
@@ -633,12 +835,19 @@ def list_module_categories(ctx):
         if not module_definitions:
             return
             
-        categories = module_definitions.get_categories()
-        
+        categories = _categories(module_definitions)
+
         if not categories:
             console.print("📭 [yellow]No module categories available[/yellow]")
             return
-        
+
+        if not _IS_TTY:
+            _emit_rows([(category_key,
+                         category_data.get("name", category_key.title()),
+                         category_data.get("description", "No description available"))
+                        for category_key, category_data in categories.items()])
+            return
+
         console.print("📂 [cyan]Available Module Categories:[/cyan]\n")
         
         for category_key, category_data in categories.items():
@@ -16,40 +16,153 @@ Commands:
 - status diagnostics: Run comprehensive system health checks
 """
 
+import asyncio
+import functools
+import sys
+from contextlib import contextmanager
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from pkg.kubernetes import (
-    get_cluster_info,
-    validate_kubernetes_access,
-    is_cluster_ready,
-    check_module_health,
-    get_pod_status
-)
-from pkg.module_detector import detect_running_modules, validate_module_health
-
-console = Console()
+from pkg.console import console
+
+# rich's table/progress machinery and the kubernetes helpers are imported
+# lazily inside the commands that need them, so cheap invocations (--help,
+# unrelated subcommands) skip their import cost entirely
+
+
+# Status → rendered cell lookup tables, so per-row formatting is one dict
+# hit instead of a branch cascade with f-string rebuilds
+_MODULE_STATUS_STYLE = {
+    'running': "[green]✅ Running[/green]",
+    'pending': "[yellow]⏳ Pending[/yellow]",
+    'failed': "[red]❌ Failed[/red]",
+}
+_POD_STATUS_COLOR = {
+    'Running': 'green',
+    'Pending': 'yellow',
+}
+
+@functools.lru_cache(maxsize=32)
+def _unknown_status_style(status):
+    """Render (and memoize) the fallback cell for an unrecognized status"""
+    return f"[dim]❓ {status}[/dim]"
+
+def _module_rows(modules, tenant_namespace):
+    """Yield (status, row_tuple) per module, formatted and ready to render
+
+    A single generator pass feeds both the status table and the running
+    count, so the module map is walked exactly once per environment.
+    """
+    for module_name, module_info in modules.items():
+        status = module_info.get('status', 'unknown')
+        yield status, (
+            module_name,
+            _MODULE_STATUS_STYLE.get(status) or _unknown_status_style(status),
+            module_info.get('namespace', tenant_namespace),
+            str(module_info.get('replicas', 'N/A')),
+            module_info.get('endpoint', 'N/A')
+        )
+
+def _emit_json(payload):
+    """Serialize payload straight to stdout, bypassing rich entirely"""
+    try:
+        import orjson
+        sys.stdout.buffer.write(orjson.dumps(payload) + b"\n")
+    except ImportError:
+        import json
+        sys.stdout.write(json.dumps(payload) + "\n")
+
+@contextmanager
+def _spinner(description):
+    """Show a Progress spinner only on a real terminal.
+
+    Piped/CI invocations skip the render thread and its ANSI writes
+    entirely; callers receive None in that case.
+    """
+    if not console.is_terminal:
+        yield None
+        return
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield progress
 
 @click.group(invoke_without_command=True)
 @click.option('--env', '-e', default=None, help='Environment (dev, staging, prod)')
 @click.option('--all-envs', '-a', is_flag=True, help='Show status for all environments')
+@click.option('--no-cache', is_flag=True, help='Bypass the local API response cache')
+@click.option('--output', '-o', type=click.Choice(['table', 'json', 'ndjson']),
+              default=None,
+              help='Output format (json/ndjson bypass all terminal formatting)')
 @click.pass_context
-def status_group(ctx, env, all_envs):
+def status_group(ctx, env, all_envs, no_cache, output):
     """Get status of tenant environments and modules"""
+    if no_cache:
+        ctx.obj['api_client'].cache_enabled = False
     if ctx.invoked_subcommand is None:
         # If no subcommand is provided, run the main status functionality
-        show_status(ctx, env, all_envs)
+        show_status(ctx, env, all_envs, output or ctx.obj.get('output', 'table'))
+
+def _fetch_env_modules(api_client, tenant_name, environment, tenant_namespace):
+    """Fetch the module status map for one environment (API first, cluster fallback)
+
+    Returns (modules, note) where note is a message about any fallback taken.
+    """
+    # Try API first, fallback to direct cluster detection
+    try:
+        status_data = api_client.get_tenant_status(tenant_name, environment)
+
+        # Index environments by name so the lookup is a single dict hit
+        # rather than a linear scan over every environment's module list
+        by_env = {
+            e.get('environment'): e
+            for e in status_data.get('environments', [])
+        }
+        env_data = by_env.get(environment)
+        if env_data is None:
+            return {}, None
+
+        env_namespace = env_data.get('namespace', tenant_namespace)
+        modules = {
+            module['name']: {
+                'status': module.get('status', 'unknown'),
+                'namespace': env_namespace,
+                'replicas': f"{module.get('ready_replicas', 0)}/{module.get('replicas', 0)}",
+                'endpoint': 'N/A'  # Will be populated later if needed
+            }
+            for module in env_data.get('modules', [])
+            if module.get('name')
+        }
+        return modules, None
+
+    except Exception as e:
+        # Fallback to direct cluster detection
+        from pkg.module_detector import detect_running_modules
+
+        detected_modules = detect_running_modules(tenant_namespace)
+        modules = {}
+        for module_name, module_info in detected_modules.items():
+            modules[module_name] = {
+                'status': module_info['status'],
+                'namespace': module_info['namespace'],
+                'replicas': f"{module_info['pods']}/{module_info['pods']}",
+                'endpoint': ', '.join(module_info['endpoints'][:2]) if module_info['endpoints'] else 'N/A'
+            }
+        return modules, f"API unavailable ({e}), scanned cluster directly"
 
-def show_status(ctx, env, all_envs):
+def show_status(ctx, env, all_envs, output='table'):
     """Show status of all modules in an environment"""
+    from rich.table import Table
+
     config = ctx.obj['config']
     api_client = ctx.obj['api_client']
-    
+
     tenant_name = config.tenant_name
-    
+
     # Determine which environments to check
     environments = []
     if all_envs:
@@ -57,92 +170,70 @@ def show_status(ctx, env, all_envs):
     else:
         env = env or config.default_environment
         environments = [env]
-    
+
     try:
-        for environment in environments:
-            console.print(f"\n🔍 [cyan]Checking status for environment: {environment}[/cyan]")
-            
+        # Fan the per-environment checks out concurrently so --all-envs costs
+        # roughly one round trip instead of one per environment
+        async def _gather_envs():
+            async def _one(environment):
+                tenant_namespace = f"{tenant_name}-{environment}"
+                # run_in_executor rather than asyncio.to_thread keeps the
+                # declared 3.8 floor (to_thread is 3.9+)
+                modules, note = await asyncio.get_running_loop().run_in_executor(
+                    None, _fetch_env_modules, api_client, tenant_name,
+                    environment, tenant_namespace
+                )
+                return environment, modules, note
+
+            return await asyncio.gather(*[_one(e) for e in environments])
+
+        if output in ('json', 'ndjson'):
+            # Machine consumers: serialize the raw module maps directly,
+            # no spinner and no rich rendering
+            env_results = asyncio.run(_gather_envs())
+            records = [
+                {'environment': environment, 'modules': modules}
+                for environment, modules, _ in env_results
+            ]
+            if output == 'ndjson':
+                for record in records:
+                    _emit_json(record)
+            else:
+                _emit_json(records)
+            return
+
+        with _spinner(f"Detecting modules in {len(environments)} environment(s)..."):
+            env_results = asyncio.run(_gather_envs())
+
+        # Rendering stays on the main thread, in environment order
+        for environment, modules, note in env_results:
             tenant_namespace = f"{tenant_name}-{environment}"
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                progress.add_task(f"Detecting modules in {tenant_namespace}...", total=None)
-                
-                # Try API first, fallback to direct cluster detection
-                try:
-                    status_data = api_client.get_tenant_status(tenant_name, environment)
-                    
-                    # Extract modules from the API response format
-                    modules = {}
-                    for env_data in status_data.get('environments', []):
-                        if env_data.get('environment') == environment:
-                            env_modules = env_data.get('modules', [])
-                            for module in env_modules:
-                                module_name = module.get('name')
-                                if module_name:
-                                    modules[module_name] = {
-                                        'status': module.get('status', 'unknown'),
-                                        'namespace': env_data.get('namespace', tenant_namespace),
-                                        'replicas': f"{module.get('ready_replicas', 0)}/{module.get('replicas', 0)}",
-                                        'endpoint': 'N/A'  # Will be populated later if needed
-                                    }
-                            break
-                            
-                except Exception as e:
-                    # Fallback to direct cluster detection
-                    console.print(f"[dim]API unavailable ({e}), scanning cluster directly...[/dim]")
-                    detected_modules = detect_running_modules(tenant_namespace)
-                    modules = {}
-                    for module_name, module_info in detected_modules.items():
-                        modules[module_name] = {
-                            'status': module_info['status'],
-                            'namespace': module_info['namespace'],
-                            'replicas': f"{module_info['pods']}/{module_info['pods']}",
-                            'endpoint': ', '.join(module_info['endpoints'][:2]) if module_info['endpoints'] else 'N/A'
-                        }
-            
+            console.print(f"\n🔍 [cyan]Checking status for environment: {environment}[/cyan]")
+            if note:
+                console.print(f"[dim]{note}[/dim]")
+
             if not modules:
                 console.print(f"📭 [yellow]No modules deployed in {environment} environment[/yellow]")
                 continue
             
-            # Create status table
             table = Table(title=f"📊 Module Status - {environment.upper()} Environment")
             table.add_column("Module", style="cyan", no_wrap=True)
             table.add_column("Status", style="white")
             table.add_column("Namespace", style="dim")
             table.add_column("Replicas", style="green")
             table.add_column("Endpoint", style="blue")
-            
-            for module_name, module_info in modules.items():
-                status = module_info.get('status', 'unknown')
-                
-                # Color code the status
-                if status == 'running':
-                    status_display = "[green]✅ Running[/green]"
-                elif status == 'pending':
-                    status_display = "[yellow]⏳ Pending[/yellow]"
-                elif status == 'failed':
-                    status_display = "[red]❌ Failed[/red]"
-                else:
-                    status_display = f"[dim]❓ {status}[/dim]"
-                
-                table.add_row(
-                    module_name,
-                    status_display,
-                    module_info.get('namespace', tenant_namespace),
-                    str(module_info.get('replicas', 'N/A')),
-                    module_info.get('endpoint', 'N/A')
-                )
-            
+
+            # One generator pass drives both the table and the summary count
+            running_modules = 0
+            for status, row in _module_rows(modules, tenant_namespace):
+                running_modules += (status == 'running')
+                table.add_row(*row)
+
             console.print(table)
             
             # Show summary
             total_modules = len(modules)
-            running_modules = sum(1 for m in modules.values() if m.get('status') == 'running')
-            
+
             summary_text = f"Total modules: {total_modules} | Running: {running_modules}"
             if running_modules == total_modules:
                 summary_text = f"[green]{summary_text} ✅[/green]"
@@ -160,17 +251,14 @@ def show_status(ctx, env, all_envs):
 @click.pass_context
 def health_check(ctx):
     """Check health of the Spanda Platform backend"""
+    from rich.panel import Panel
+
     api_client = ctx.obj['api_client']
     
     try:
         console.print("🏥 [cyan]Checking Spanda Platform health...[/cyan]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Connecting to backend...", total=None)
+        with _spinner("Connecting to backend..."):
             health_data = api_client.health_check()
         
         # Display health information
@@ -213,6 +301,15 @@ def health_check(ctx):
 @click.pass_context
 def cluster_info(ctx):
     """Show Kubernetes cluster information"""
+    from rich.table import Table
+
+    from pkg.kubernetes import (
+        get_cluster_info,
+        validate_kubernetes_access,
+        is_cluster_ready,
+        get_pod_status
+    )
+
     try:
         console.print("☸️ [cyan]Checking Kubernetes cluster...[/cyan]")
         
@@ -239,24 +336,20 @@ def cluster_info(ctx):
                     console.print(f"   {line}")
         
         if 'nodes' in cluster_data:
+            rows = []
+            for node in cluster_data['nodes']:
+                status_color = "green" if node['status'] == "Ready" else "red"
+                status_display = f"[{status_color}]{node['status']}[/{status_color}]"
+                rows.append((node['name'], status_display, node['roles_str'], node['version']))
+
             table = Table(title="🖥️ Cluster Nodes")
             table.add_column("Name", style="cyan")
             table.add_column("Status", style="white")
             table.add_column("Roles", style="green")
             table.add_column("Version", style="blue")
-            
-            for node in cluster_data['nodes']:
-                status_color = "green" if node['status'] == "Ready" else "red"
-                status_display = f"[{status_color}]{node['status']}[/{status_color}]"
-                roles_str = ', '.join(node['roles'])
-                
-                table.add_row(
-                    node['name'],
-                    status_display,
-                    roles_str,
-                    node['version']
-                )
-            
+            for row in rows:
+                table.add_row(*row)
+
             console.print(table)
         
         # Show namespace summary for tenant
@@ -270,24 +363,21 @@ def cluster_info(ctx):
         
         if pods:
             console.print(f"📦 Found {len(pods)} pods in tenant namespace")
+            pod_rows = []
+            for pod in pods:
+                status = pod['status']
+                status_color = _POD_STATUS_COLOR.get(status, 'red')
+                status_display = f"[{status_color}]{status}[/{status_color}]"
+                pod_rows.append((pod['name'], status_display, pod['ready'], str(pod['restarts'])))
+
             pod_table = Table(title=f"Pods in {tenant_namespace}")
             pod_table.add_column("Name", style="cyan")
             pod_table.add_column("Status", style="white")
             pod_table.add_column("Ready", style="green")
             pod_table.add_column("Restarts", style="yellow")
-            
-            for pod in pods:
-                status = pod['status']
-                status_color = "green" if status == "Running" else "yellow" if status == "Pending" else "red"
-                status_display = f"[{status_color}]{status}[/{status_color}]"
-                
-                pod_table.add_row(
-                    pod['name'],
-                    status_display,
-                    pod['ready'],
-                    str(pod['restarts'])
-                )
-            
+            for row in pod_rows:
+                pod_table.add_row(*row)
+
             console.print(pod_table)
         else:
             console.print(f"📭 [dim]No pods found in {tenant_namespace} namespace[/dim]")
@@ -16,70 +16,279 @@ Commands:
 - tenants delete: Remove tenant and cleanup resources
 """
 
+import asyncio
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from pkg.console import console
+
+# rich's table/panel/progress modules are imported inside the commands that
+# render them, keeping lightweight invocations (current, switch, --help) on
+# the pure click parse path
+
+
+# Config-repo layout, resolved once at import time. Overridable via
+# SPANDAK8S_CONFIG_REPO so the CLI works outside the original dev machine.
+_CONFIG_REPO = Path(os.environ.get(
+    'SPANDAK8S_CONFIG_REPO', '~/.spandak8s/config-repo'
+)).expanduser()
+_TENANT_SOURCES_FILE = _CONFIG_REPO / "tenants" / "tenant-sources.yml"
+_TENANT_INFRA = _CONFIG_REPO / "tenants" / "infrastructure"
+_SCRIPTS_PATH = _CONFIG_REPO / "scripts"
+
+_BASH = shutil.which('bash') or '/bin/bash'
+
+# Tenant status → rendered cell, one dict hit per row instead of branching
+_TENANT_STATUS_STYLE = {
+    'active': "[green]✅ Active[/green]",
+    'inactive': "[red]❌ Inactive[/red]",
+}
+
+def _emit_json(payload):
+    """Serialize payload straight to stdout, bypassing rich entirely"""
+    try:
+        import orjson
+        sys.stdout.buffer.write(orjson.dumps(payload) + b"\n")
+    except ImportError:
+        import json
+        sys.stdout.write(json.dumps(payload) + "\n")
+
+@contextmanager
+def _spinner(description):
+    """Show a Progress spinner only on a real terminal.
+
+    Piped/CI invocations skip the render thread and its ANSI writes
+    entirely; callers receive None in that case.
+    """
+    if not console.is_terminal:
+        yield None
+        return
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield progress
+
+def _fetch_with_spinner(description, func, *args, **kwargs):
+    """Run a blocking call on a worker thread while a spinner animates.
+
+    Keeps the render loop on the main thread so the spinner stays smooth
+    through the JSON-decode stretches where the worker holds the GIL
+    briefly. Off-terminal this is just a plain call.
+    """
+    with _spinner(description) as progress:
+        if progress is None:
+            return func(*args, **kwargs)
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as exe:
+            future = exe.submit(func, *args, **kwargs)
+            while not future.done():
+                progress.refresh()
+                time.sleep(0.05)
+            return future.result()
+
+def _count_running(environments):
+    """Count running modules across a tenant's environment entries"""
+    return sum(
+        1
+        for env in environments
+        for module in env.get('modules', [])
+        if module.get('status') == 'running'
+    )
+
+def _tenant_row(tenant):
+    """Pre-format one tenant dict into a ready-to-render row tuple"""
+    get = tenant.get  # bind once; the cascade below probes the dict 5 times
+    status = get('status', 'unknown')
+    environments = get('environments')
+    return (
+        get('name', 'Unknown'),
+        _TENANT_STATUS_STYLE.get(status) or f"[dim]❓ {status}[/dim]",
+        ', '.join(environments) if environments else 'None',
+        str(len(get('modules', ()))),
+        get('created_at', 'N/A')
+    )
 
-console = Console()
+async def _drain_lines(stream, on_line, tail_size=20):
+    """Consume a subprocess stream line by line, keeping only the tail
+
+    Feeds each decoded line to on_line (if given) for live display instead
+    of buffering the whole output, and returns the last tail_size lines for
+    error reporting.
+    """
+    tail = []
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        text = line.decode(errors='replace').rstrip()
+        if on_line and text:
+            on_line(text)
+        tail.append(text)
+        if len(tail) > tail_size:
+            del tail[0]
+    return '\n'.join(tail)
+
+async def _run_tenant_setup(tenant_name, on_line=None):
+    """Run the onboarding script and namespace pre-creation concurrently
+
+    The final kubectl apply depends on the onboarding script's output, but
+    idempotent namespace pre-creation does not, so both run in parallel and
+    the caller only pays for the slower of the two. The onboarding script's
+    output is streamed through on_line rather than buffered whole.
+
+    Returns ((onboard_rc, onboard_tail), (ns_rc, ns_stderr)).
+    """
+    onboard = await asyncio.create_subprocess_exec(
+        _BASH, "onboard-tenants.sh", tenant_name,
+        cwd=str(_SCRIPTS_PATH),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+    # Two exec'd kubectl processes joined by an OS pipe instead of a shell
+    # pipeline: the tenant name stays a plain argv element (no shell
+    # interpolation) and neither exit status is masked by the pipe
+    read_fd, write_fd = os.pipe()
+    try:
+        dry_run = await asyncio.create_subprocess_exec(
+            "kubectl", "create", "namespace", f"{tenant_name}-dev",
+            "--dry-run=client", "-o", "yaml",
+            stdout=write_fd,
+            stderr=asyncio.subprocess.PIPE
+        )
+    finally:
+        os.close(write_fd)
+    try:
+        apply = await asyncio.create_subprocess_exec(
+            "kubectl", "apply", "-f", "-",
+            stdin=read_fd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    finally:
+        os.close(read_fd)
+
+    onboard_tail, (_, dry_run_err), (_, apply_err) = await asyncio.gather(
+        _drain_lines(onboard.stdout, on_line),
+        dry_run.communicate(), apply.communicate()
+    )
+    await onboard.wait()
+    ns_rc = dry_run.returncode or apply.returncode
+    ns_err = b'\n'.join(err for err in (dry_run_err, apply_err) if err)
+    return (
+        (onboard.returncode, onboard_tail),
+        (ns_rc, ns_err.decode(errors='replace'))
+    )
 
 @click.group()
-def tenants_group():
+@click.option('--no-cache', is_flag=True, help='Bypass the local API response cache')
+@click.pass_context
+def tenants_group(ctx, no_cache):
     """Manage tenants and their configurations"""
-    pass
+    if no_cache:
+        ctx.obj['api_client'].cache_enabled = False
 
 @tenants_group.command('list')
+@click.option('--detailed', is_flag=True,
+              help='Also fetch live status for every tenant (concurrent)')
+@click.option('--output', '-o', type=click.Choice(['table', 'json', 'ndjson']),
+              default=None,
+              help='Output format (json/ndjson bypass all terminal formatting)')
 @click.pass_context
-def list_tenants(ctx):
+def list_tenants(ctx, detailed, output):
     """List all tenants"""
+    from rich.table import Table
+
     api_client = ctx.obj['api_client']
-    
+    if output is None:
+        output = ctx.obj.get('output', 'table')
+
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task("Fetching tenants...", total=None)
+        if output in ('json', 'ndjson') and not detailed:
             tenants = api_client.list_tenants()
-        
+            if output == 'ndjson':
+                # One record per line so downstream tools can stream
+                for tenant in tenants:
+                    _emit_json(tenant)
+            else:
+                _emit_json(tenants)
+            return
+
+        tenants = _fetch_with_spinner("Fetching tenants...", api_client.list_tenants)
+
         if not tenants:
             console.print("📭 [yellow]No tenants found[/yellow]")
             return
-        
+
+        # --detailed prefers the batched server-side endpoint (one request,
+        # detail inlined per tenant); older backends get the concurrent
+        # per-tenant fan-out instead
+        running_by_name = None
+        if detailed:
+            names = [t.get('name') for t in tenants if t.get('name')]
+            try:
+                detailed_tenants = _fetch_with_spinner(
+                    f"Fetching detail for {len(names)} tenant(s)...",
+                    api_client.list_tenants_detailed, names=names
+                )
+                running_by_name = {
+                    t.get('name'): _count_running(t.get('environments', []))
+                    for t in detailed_tenants
+                }
+            except Exception:
+                try:
+                    statuses = _fetch_with_spinner(
+                        f"Fetching status for {len(names)} tenant(s)...",
+                        api_client.multi_get,
+                        [(f"/api/v1/tenants/{name}/status", None) for name in names]
+                    )
+                    running_by_name = {
+                        name: _count_running(status.get('environments', []))
+                        for name, status in zip(names, statuses)
+                    }
+                except Exception as e:
+                    console.print(f"[dim]Status fetch failed ({e}), showing summary only[/dim]")
+
+        if output in ('json', 'ndjson'):
+            payload = [dict(t) for t in tenants]
+            if running_by_name is not None:
+                for t in payload:
+                    t['running_modules'] = running_by_name.get(t.get('name'), 0)
+            if output == 'ndjson':
+                for t in payload:
+                    _emit_json(t)
+            else:
+                _emit_json(payload)
+            return
+
+        # Pre-format every tenant into a row tuple in one comprehension pass,
+        # then feed the finished rows to the table
+        rows = [_tenant_row(tenant) for tenant in tenants]
+
         table = Table(title="🏢 Platform Tenants")
         table.add_column("Name", style="cyan", no_wrap=True)
         table.add_column("Status", style="white")
         table.add_column("Environments", style="green")
         table.add_column("Modules", style="blue")
         table.add_column("Created", style="dim")
-        
-        for tenant in tenants:
-            # Get status color
-            status = tenant.get('status', 'unknown')
-            if status == 'active':
-                status_display = "[green]✅ Active[/green]"
-            elif status == 'inactive':
-                status_display = "[red]❌ Inactive[/red]"
-            else:
-                status_display = f"[dim]❓ {status}[/dim]"
-            
-            # Format environments
-            environments = tenant.get('environments', [])
-            env_display = ', '.join(environments) if environments else 'None'
-            
-            # Count modules
-            module_count = len(tenant.get('modules', []))
-            
-            table.add_row(
-                tenant.get('name', 'Unknown'),
-                status_display,
-                env_display,
-                str(module_count),
-                tenant.get('created_at', 'N/A')
-            )
-        
+        if running_by_name is not None:
+            table.add_column("Running", style="green")
+            rows = [
+                row + (str(running_by_name.get(tenant.get('name'), 0)),)
+                for row, tenant in zip(rows, tenants)
+            ]
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
         
     except Exception as e:
@@ -98,25 +307,15 @@ def list_tenants(ctx):
 def create_tenant(ctx, tenant_name, cpu_quota, memory_quota, storage_quota, pvc_quota, git_org, environments, description):
     """Create a new tenant with infrastructure setup"""
     import subprocess
-    import os
-    from pathlib import Path
-    
+
     config = ctx.obj['config']
     api_client = ctx.obj['api_client']
-    
+
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            
-            # Step 1: Create tenant configuration in config-repo
-            progress.add_task("Creating tenant configuration...", total=None)
-            
-            config_repo_path = Path("C:/Users/aryan/OneDrive/Documents/spanda docs/config-repo")
-            tenant_sources_file = config_repo_path / "tenants" / "tenant-sources.yml"
-            
+        # Step 1: Create tenant configuration in config-repo
+        with _spinner("Creating tenant configuration...") as progress:
+            tenant_sources_file = _TENANT_SOURCES_FILE
+
             # Add tenant to tenant-sources.yml
             tenant_config = f"""
   # {tenant_name.title()} Tenant
@@ -131,36 +330,72 @@ def create_tenant(ctx, tenant_name, cpu_quota, memory_quota, storage_quota, pvc_
     environments: {environments.split(',')}
     modules: []  # Start with no modules enabled
 """
-            
-            # Step 2: Run onboard-tenants.sh script
-            progress.add_task("Running tenant onboarding script...", total=None)
-            
-            scripts_path = config_repo_path / "scripts"
-            result = subprocess.run(
-                ["bash", "onboard-tenants.sh", tenant_name],
-                cwd=scripts_path,
-                capture_output=True,
-                text=True
+
+            # Validate the existing registry before touching it, then append
+            # the self-contained list item without round-tripping the whole
+            # document through load + dump
+            import yaml
+            try:
+                from yaml import CSafeLoader as YamlLoader  # libyaml, ~5-10x faster
+            except ImportError:
+                from yaml import SafeLoader as YamlLoader
+
+            if tenant_sources_file.exists():
+                with open(tenant_sources_file, 'r', encoding='utf-8') as f:
+                    try:
+                        yaml.load(f, Loader=YamlLoader)
+                    except yaml.YAMLError as e:
+                        console.print(f"❌ [red]Existing {tenant_sources_file} is not valid YAML: {e}[/red]")
+                        return
+            else:
+                tenant_sources_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(tenant_sources_file, 'w', encoding='utf-8') as f:
+                    f.write("tenants:\n")
+
+            with open(tenant_sources_file, 'a', encoding='utf-8') as f:
+                f.write(tenant_config)
+
+
+            # Step 2: Run the onboarding script while pre-creating the
+            # namespace, since neither depends on the other. Script output
+            # streams into the task description as it arrives.
+            if progress is not None:
+                onboard_task = progress.add_task("Running tenant onboarding script...", total=None)
+
+                def _show_line(line):
+                    progress.update(onboard_task, description=f"onboarding: {line[:60]}")
+            else:
+                _show_line = None
+
+            (onboard_rc, onboard_err), (ns_rc, ns_err) = asyncio.run(
+                _run_tenant_setup(tenant_name, on_line=_show_line)
             )
-            
-            if result.returncode != 0:
-                console.print(f"❌ [red]Error running onboard script: {result.stderr}[/red]")
+
+            if onboard_rc != 0:
+                console.print(f"❌ [red]Error running onboard script: {onboard_err}[/red]")
                 return
-            
-            # Step 3: Create namespace and apply basic resources
-            progress.add_task("Creating Kubernetes namespace and quotas...", total=None)
-            
+
+            if ns_rc != 0:
+                # Namespace pre-creation is best-effort; the apply below
+                # still establishes the tenant resources
+                console.print(f"⚠️ [yellow]Namespace pre-creation failed: {ns_err}[/yellow]")
+
+            # Step 3: Apply quotas and basic resources
+            if progress is not None:
+                progress.add_task("Creating Kubernetes namespace and quotas...", total=None)
+
             # Apply the generated tenant configuration
-            tenant_infra_path = config_repo_path / "tenants" / "infrastructure"
-            
             result = subprocess.run([
-                "kubectl", "apply", "-f", f"{tenant_infra_path}/{tenant_name}-values.yaml"
+                "kubectl", "apply", "-f", f"{_TENANT_INFRA}/{tenant_name}-values.yaml"
             ], capture_output=True, text=True)
             
             if result.returncode != 0:
                 console.print(f"❌ [red]Error applying tenant configuration: {result.stderr}[/red]")
                 return
             
+        # Cached tenant listings are stale now that a tenant was added
+        api_client.invalidate_cache()
+
         console.print(f"✅ [green]Tenant '{tenant_name}' created successfully![/green]")
         console.print(f"🏢 Namespace: {tenant_name}-dev")
         console.print(f"📊 Resources: {cpu_quota} CPU, {memory_quota} Memory, {storage_quota} Storage, {pvc_quota} PVCs")
@@ -169,26 +404,76 @@ def create_tenant(ctx, tenant_name, cpu_quota, memory_quota, storage_quota, pvc_
     except Exception as e:
         console.print(f"❌ [red]Error creating tenant: {e}[/red]")
 
+def _fetch_info_with_status(config, api_client, tenant_name):
+    """Fetch tenant info and live status concurrently.
+
+    Prefers the async client (one event loop, overlapped waits); when httpx
+    is not installed, the sync client's thread-pool fan-out does the same
+    job. Returns (info, status_data).
+    """
+    try:
+        from pkg.api_client_async import AsyncSpandaAPIClient
+
+        async def _go():
+            client = AsyncSpandaAPIClient(config)
+            try:
+                return await client.gather(
+                    client.get_tenant_info(tenant_name),
+                    client.get_tenant_status(tenant_name)
+                )
+            finally:
+                await client.aclose()
+
+        return tuple(asyncio.run(_go()))
+    except Exception:
+        return tuple(api_client.multi_get([
+            (f"/api/v1/tenants/{tenant_name}", None),
+            (f"/api/v1/tenants/{tenant_name}/status", None)
+        ]))
+
 @tenants_group.command('info')
 @click.argument('tenant_name', required=False)
+@click.option('--with-status', is_flag=True,
+              help='Also fetch live module status (fetched concurrently)')
+@click.option('--output', '-o', type=click.Choice(['table', 'json', 'ndjson']),
+              default=None,
+              help='Output format (json bypasses all terminal formatting)')
 @click.pass_context
-def tenant_info(ctx, tenant_name):
+def tenant_info(ctx, tenant_name, with_status, output):
     """Get detailed information about a tenant"""
+    from rich.panel import Panel
+
     config = ctx.obj['config']
     api_client = ctx.obj['api_client']
-    
+
     # Use current tenant if none specified
     if not tenant_name:
         tenant_name = config.tenant_name
-    
+
+    if output is None:
+        output = ctx.obj.get('output', 'table')
+
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task(f"Fetching info for {tenant_name}...", total=None)
-            tenant_data = api_client.get_tenant_info(tenant_name)
+        status_data = None
+        # A single record, so ndjson degenerates to json here
+        if output in ('json', 'ndjson'):
+            if with_status:
+                info, status_data = _fetch_info_with_status(config, api_client, tenant_name)
+                _emit_json({'info': info, 'status': status_data})
+            else:
+                _emit_json(api_client.get_tenant_info(tenant_name))
+            return
+
+        if with_status:
+            tenant_data, status_data = _fetch_with_spinner(
+                f"Fetching info for {tenant_name}...",
+                _fetch_info_with_status, config, api_client, tenant_name
+            )
+        else:
+            tenant_data = _fetch_with_spinner(
+                f"Fetching info for {tenant_name}...",
+                api_client.get_tenant_info, tenant_name
+            )
         
         # Display tenant information in a panel
         info_text = f"[bold cyan]{tenant_name}[/bold cyan]\n\n"
@@ -223,6 +508,10 @@ def tenant_info(ctx, tenant_name):
                 status = module.get('status', 'unknown')
                 info_text += f"  • {name} ({env}): {status}\n"
         
+        if status_data is not None:
+            running = _count_running(status_data.get('environments', []))
+            info_text += f"\n[bold]Live Status:[/bold] {running} module(s) running\n"
+
         console.print(Panel(info_text, title="🏢 Tenant Information", border_style="cyan"))
         
     except Exception as e:
@@ -230,6 +519,76 @@ def tenant_info(ctx, tenant_name):
 
 
 
+def _watch_table(tenant_name, status_data):
+    """Render one live table frame from a tenant status payload"""
+    from rich.table import Table
+
+    status_style = {
+        'running': "[green]✅ running[/green]",
+        'pending': "[yellow]⏳ pending[/yellow]",
+        'failed': "[red]❌ failed[/red]",
+    }
+
+    table = Table(title=f"👁️ {tenant_name} - Live Module Status")
+    table.add_column("Environment", style="cyan")
+    table.add_column("Module", style="white")
+    table.add_column("Status", style="white")
+    table.add_column("Replicas", style="green")
+
+    for env in status_data.get('environments', []):
+        env_name = env.get('environment', 'unknown')
+        for module in env.get('modules', []):
+            status = module.get('status', 'unknown')
+            table.add_row(
+                env_name,
+                module.get('name', 'unknown'),
+                status_style.get(status, f"[dim]❓ {status}[/dim]"),
+                f"{module.get('ready_replicas', 0)}/{module.get('replicas', 0)}"
+            )
+    return table
+
+@tenants_group.command('watch')
+@click.argument('tenant_name', required=False)
+@click.pass_context
+def watch_tenant(ctx, tenant_name):
+    """Watch tenant status live (streams from the backend)"""
+    import time
+
+    from rich.live import Live
+
+    config = ctx.obj['config']
+    api_client = ctx.obj['api_client']
+
+    if not tenant_name:
+        tenant_name = config.tenant_name
+
+    console.print(f"👁️ [cyan]Watching tenant '{tenant_name}' (Ctrl+C to stop)[/cyan]")
+
+    try:
+        try:
+            # One long-lived SSE request; the server pushes only on change
+            with Live(console=console, refresh_per_second=4) as live:
+                for status_data in api_client.stream_tenant_status(tenant_name):
+                    live.update(_watch_table(tenant_name, status_data))
+        except KeyboardInterrupt:
+            raise
+        except Exception:
+            # Backend without the watch endpoint: degrade to 3s polling,
+            # bypassing the response caches so every frame is fresh
+            console.print("[dim]Watch stream unavailable, polling every 3s[/dim]")
+            cache_was_enabled = api_client.cache_enabled
+            api_client.cache_enabled = False
+            try:
+                with Live(console=console, refresh_per_second=4) as live:
+                    while True:
+                        status_data = api_client.get_tenant_status(tenant_name)
+                        live.update(_watch_table(tenant_name, status_data))
+                        time.sleep(3)
+            finally:
+                api_client.cache_enabled = cache_was_enabled
+    except KeyboardInterrupt:
+        console.print("\n👋 [dim]Stopped watching[/dim]")
+
 @tenants_group.command('switch')
 @click.argument('tenant_name')
 @click.pass_context
@@ -240,12 +599,14 @@ def switch_tenant(ctx, tenant_name):
     try:
         # Update configuration
         config.set('tenant.name', tenant_name)
-        
-        console.print(f"🔄 [green]Switched to tenant '{tenant_name}'[/green]")
-        console.print("💡 [dim]All future commands will operate on this tenant[/dim]")
-        
+        ctx.obj['api_client'].invalidate_cache()
+
+        # Plain output: two simple lines don't warrant rich's markup parser
+        click.echo(f"🔄 Switched to tenant '{tenant_name}'")
+        click.echo("💡 All future commands will operate on this tenant")
+
     except Exception as e:
-        console.print(f"❌ [red]Error switching tenant: {e}[/red]")
+        click.echo(f"❌ Error switching tenant: {e}", err=True)
 
 @tenants_group.command('current')
 @click.pass_context
@@ -253,7 +614,14 @@ def current_tenant(ctx):
     """Show current tenant"""
     config = ctx.obj['config']
     tenant_name = config.tenant_name
-    
+
+    if ctx.obj.get('output') in ('json', 'ndjson'):
+        try:
+            _emit_json(ctx.obj['api_client'].get_tenant_info(tenant_name))
+        except Exception:
+            _emit_json({'name': tenant_name})
+        return
+
     console.print(f"🏢 Current tenant: [cyan]{tenant_name}[/cyan]")
     
     # Try to get additional info about the tenant
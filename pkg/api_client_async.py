@@ -0,0 +1,108 @@
+"""
+Spandak8s CLI - Async Backend API Client
+
+Async sibling of SpandaAPIClient for commands that fetch several endpoints
+at once: a single event loop overlaps the network waits so total latency is
+the slowest call, not the sum. Built on httpx.AsyncClient, which is an
+optional dependency — constructing the client without httpx installed
+raises with an install hint, and callers fall back to the sync client's
+thread-pool fan-out.
+
+The sync client remains the default for single-call commands; this module
+is only pulled in by the paths that benefit from gather()-style fan-out.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from pkg.config import SpandaConfig
+
+# Multiplex concurrent calls over one connection when the h2 package is
+# installed; SPANDAK8S_HTTP1=1 forces HTTP/1.1 for debugging or proxies
+# that mishandle upgrades
+try:
+    import h2  # noqa: F401
+    _HTTP2 = os.environ.get('SPANDAK8S_HTTP1') != '1'
+except ImportError:
+    _HTTP2 = False
+
+# Process-wide instance shared per (base_url, token), mirroring the sync
+# client's get_or_create behavior
+_CLIENTS: Dict[tuple, 'AsyncSpandaAPIClient'] = {}
+
+
+class AsyncSpandaAPIClient:
+    """Async client for the Spanda Platform hybrid backend"""
+
+    def __init__(self, config: SpandaConfig):
+        try:
+            import httpx
+        except ImportError:
+            raise Exception(
+                "httpx is required for async API calls: pip install httpx"
+            )
+
+        self.config = config
+        self.base_url = config.api_base_url.rstrip('/')
+        self.timeout = config.api_timeout
+
+        headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'spandak8s-cli/0.1.0'
+        }
+        headers.update(config.get_auth_headers())
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=headers,
+            http2=_HTTP2
+        )
+
+    @classmethod
+    def get_or_create(cls, config: SpandaConfig) -> 'AsyncSpandaAPIClient':
+        """Return the shared async client for this backend/credential pair"""
+        key = (config.api_base_url, config.auth_token)
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = cls(config)
+            _CLIENTS[key] = client
+        return client
+
+    async def _get_json(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """GET an endpoint and return the decoded JSON body"""
+        try:
+            response = await self._client.get(endpoint, params=params)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            raise Exception(f"API request failed: {e}")
+
+    async def list_tenants(self) -> List[Dict[str, Any]]:
+        """List all tenants from Kubernetes"""
+        result = await self._get_json("/api/v1/tenants")
+        return result.get('tenants', [])
+
+    async def get_tenant_info(self, tenant_name: str) -> Dict[str, Any]:
+        """Get detailed information about a tenant"""
+        return await self._get_json(f"/api/v1/tenants/{tenant_name}")
+
+    async def get_tenant_status(self, tenant_name: str,
+                                environment: str = None) -> Dict[str, Any]:
+        """Get real-time status of a tenant from Kubernetes"""
+        params = {'environment': environment} if environment else None
+        return await self._get_json(f"/api/v1/tenants/{tenant_name}/status", params=params)
+
+    async def list_modules(self) -> List[Dict[str, Any]]:
+        """Get list of all available platform modules"""
+        result = await self._get_json("/api/v1/modules")
+        return result.get('modules', [])
+
+    async def gather(self, *coroutines) -> list:
+        """Run several client coroutines concurrently, preserving order"""
+        return list(await asyncio.gather(*coroutines))
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self._client.aclose()
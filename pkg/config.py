@@ -16,17 +16,71 @@ Key Features:
 - Multi-environment support (dev/staging/prod)
 """
 
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import cached_property
+
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# libyaml-backed parser/emitter when compiled in; the pure-Python ones
+# otherwise (same output, just slower)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Process-wide instances keyed by resolved config path, so repeated
+# constructions share one parsed config instead of re-reading the file
+_CONFIGS: Dict[Path, 'SpandaConfig'] = {}
+
+
 class SpandaConfig:
     """Handles configuration loading and management for the CLI"""
-    
+
+    # cached_property names dropped whenever set() mutates the config, so
+    # repeated reads skip the dot-notation dict walk without going stale
+    _CACHED_PROPS = (
+        'api_base_url', 'api_timeout', 'api_rpm_limit', 'tenant_name',
+        'kubeconfig_path', 'default_environment', 'default_storage_class',
+        'default_tier',
+    )
+
     def __init__(self, config_path: str = "~/.spanda/config.yaml"):
         self.config_path = Path(config_path).expanduser()
         self.config = self._load_config()
-    
+        self._flat = self._flatten(self.config)
+        self._dirty = False
+        self._batch_depth = 0
+
+    @classmethod
+    def get_or_create(cls, config_path: str = "~/.spanda/config.yaml") -> 'SpandaConfig':
+        """Return the shared config instance for this path"""
+        resolved = Path(config_path).expanduser()
+        config = _CONFIGS.get(resolved)
+        if config is None:
+            config = cls(config_path)
+            _CONFIGS[resolved] = config
+        return config
+
+    @staticmethod
+    def _flatten(tree: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """Flatten a nested dict into dot-notation keys (subtrees included)"""
+        flat = {}
+        for key, value in tree.items():
+            # Interned keys let get() lookups with constant strings hit
+            # the identity fast path instead of a character compare.
+            # str() tolerates bare scalar keys (e.g. `8080:`) that YAML
+            # happily produces from hand-edited configs.
+            path = sys.intern(prefix + str(key))
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(SpandaConfig._flatten(value, path + '.'))
+        return flat
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
         if not self.config_path.exists():
@@ -34,7 +88,7 @@ class SpandaConfig:
         
         try:
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             raise Exception(f"Failed to load config from {self.config_path}: {e}")
     
@@ -72,23 +126,14 @@ class SpandaConfig:
         
         # Save default config
         with open(self.config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
+            yaml.dump(default_config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
         
         return default_config
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'api.base_url')"""
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
-    
+        return self._flat.get(key, default)
+
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation"""
         keys = key.split('.')
@@ -102,22 +147,67 @@ class SpandaConfig:
         
         # Set the final value
         config[keys[-1]] = value
-        
-        # Save to file
-        self.save()
-    
+
+        # Re-derive the dot-notation lookup map (the config is ~30 keys, so
+        # a full re-flatten is cheaper than tracking the touched subtree)
+        self._flat = self._flatten(self.config)
+
+        # Drop memoized property values that may now be stale
+        for name in self._CACHED_PROPS:
+            self.__dict__.pop(name, None)
+
+        # Persist immediately unless a batch_update is collecting writes
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch_update(self):
+        """Group several set() calls into one file write.
+
+        Inside the block, set() only mutates the in-memory config; the
+        file is serialized once on exit instead of per call.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any"""
+        if self._dirty:
+            self.save()
+
     def save(self) -> None:
-        """Save current configuration to file"""
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False, indent=2)
-    
-    @property
+        """Save current configuration to file (atomic temp file + rename)"""
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.config_path.parent),
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                yaml.dump(self.config, f, Dumper=_YamlDumper,
+                          default_flow_style=False, indent=2)
+            os.replace(tmp_path, self.config_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+
+    @cached_property
     def api_base_url(self) -> str:
         return self.get('api.base_url', 'http://localhost:8001')
     
-    @property
+    @cached_property
     def api_timeout(self) -> int:
         return self.get('api.timeout', 30)
+
+    @cached_property
+    def api_rpm_limit(self) -> int:
+        """Client-side request rate cap in requests per minute"""
+        return self.get('api.rpm_limit', 600)
     
     @property
     def auth_token(self) -> str:
@@ -131,39 +221,40 @@ class SpandaConfig:
     
     def set_auth_token(self, token: str, username: str = None) -> None:
         """Store JWT token and username"""
-        self.set('auth.token', token)
-        if username:
-            self.set('auth.username', username)
-        self.save()
-    
+        with self.batch_update():
+            self.set('auth.token', token)
+            if username:
+                self.set('auth.username', username)
+
     def clear_auth(self) -> None:
         """Clear stored authentication"""
-        self.set('auth.token', None)
-        self.set('auth.username', None)
-        self.set('auth.expires_at', None)
-        self.save()
+        with self.batch_update():
+            self.set('auth.token', None)
+            self.set('auth.username', None)
+            self.set('auth.expires_at', None)
     
     def is_authenticated(self) -> bool:
         """Check if user has valid authentication"""
         return bool(self.auth_token)
 
-    @property
+    @cached_property
     def tenant_name(self) -> str:
         return self.get('tenant.name', 'default')
     
-    @property
+    @cached_property
     def kubeconfig_path(self) -> str:
-        return self.get('kubernetes.config_path', '~/.kube/config')
+        """Kubeconfig location with ~ expanded (memoized until set())"""
+        return str(Path(self.get('kubernetes.config_path', '~/.kube/config')).expanduser())
     
-    @property
+    @cached_property
     def default_environment(self) -> str:
         return self.get('defaults.environment', 'dev')
     
-    @property
+    @cached_property
     def default_storage_class(self) -> str:
         return self.get('defaults.storage_class', 'standard')
     
-    @property
+    @cached_property
     def default_tier(self) -> str:
         return self.get('defaults.tier', 'bronze')
     
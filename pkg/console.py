@@ -0,0 +1,18 @@
+"""
+Spandak8s CLI - Shared Rich Console
+
+One Console instance for the whole process. Creating a Console per module
+repeats terminal-capability detection, and leaving width unset makes rich
+re-probe the terminal size (an ioctl) on every print — noticeable when
+rendering large tables. The width is measured once at import and the
+automatic syntax highlighter is disabled since all CLI output uses
+explicit markup.
+"""
+
+import shutil
+
+from rich.console import Console
+
+_WIDTH = shutil.get_terminal_size((120, 40)).columns
+
+console = Console(width=_WIDTH, highlight=False)
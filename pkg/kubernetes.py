@@ -19,17 +19,31 @@ Key Features:
 Based on patterns from MicroK8s for reliable Kubernetes operations.
 """
 
+import functools
 import os
 import json
+import random
 import subprocess
 import time
 import platform
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-from rich.console import Console
+from pkg.console import console
 
-console = Console()
+# kubectl JSON payloads (get pods/all -o json) run to hundreds of KB on
+# busy namespaces; orjson decodes them several times faster than the
+# stdlib, with a silent fallback when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        if isinstance(data, str):
+            data = data.encode()
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
 
 # Kubernetes binary detection - prefer local kubectl, fallback to bundled
 KUBECTL_PATHS = [
@@ -39,8 +53,35 @@ KUBECTL_PATHS = [
     "/usr/bin/kubectl",  # Package manager install
 ]
 
+# Cached kubernetes-python-client handle. The API client does one HTTP call
+# over a pooled connection where kubectl pays fork/exec plus its own TLS
+# handshake, so readers prefer it and fall back to kubectl when the client
+# library or kubeconfig is unavailable.
+_core_v1_api = None
+_core_v1_unavailable = False
+
+def _get_core_v1_api():
+    """Return a cached CoreV1Api instance, or None if the client can't be built"""
+    global _core_v1_api, _core_v1_unavailable
+    if _core_v1_api is not None or _core_v1_unavailable:
+        return _core_v1_api
+    try:
+        from kubernetes import client as k8s_client, config as k8s_config
+        k8s_config.load_kube_config()
+        _core_v1_api = k8s_client.CoreV1Api()
+    except Exception:
+        _core_v1_unavailable = True
+    return _core_v1_api
+
+@functools.lru_cache(maxsize=1)
 def get_kubectl_binary() -> str:
-    """Find the kubectl binary to use"""
+    """Find the kubectl binary to use (probed once, then cached)
+
+    run_kubectl calls this on every invocation, and paths like cluster
+    readiness polling invoke run_kubectl in a loop — without the cache
+    each of those paid an extra `kubectl version` fork/exec just to
+    rediscover the same binary.
+    """
     for kubectl_path in KUBECTL_PATHS:
         try:
             subprocess.run([kubectl_path, "version", "--client"], 
@@ -63,35 +104,43 @@ def get_current_arch() -> str:
     }
     return arch_mapping.get(platform.machine(), "amd64")
 
+# The snap environment is fixed for the lifetime of the process, so the
+# os.environ lookups happen once at import instead of on every call
+_IS_SNAP = "SNAP" in os.environ
+_SNAP_PATH = Path(os.environ["SNAP"]) if _IS_SNAP else None
+_SNAP_DATA_PATH = (Path(os.environ.get("SNAP_DATA", "/var/snap/spandak8s/current"))
+                   if _IS_SNAP else None)
+
 def is_snap_environment() -> bool:
     """Check if running in a Snap environment"""
-    return "SNAP" in os.environ
+    return _IS_SNAP
 
 def get_snap_path() -> Optional[Path]:
     """Get Snap installation path if available"""
-    if is_snap_environment():
-        return Path(os.environ["SNAP"])
-    return None
+    return _SNAP_PATH
 
 def get_snap_data_path() -> Optional[Path]:
     """Get Snap data path if available"""
-    if is_snap_environment():
-        return Path(os.environ.get("SNAP_DATA", "/var/snap/spandak8s/current"))
-    return None
+    return _SNAP_DATA_PATH
 
-def run_kubectl(*args, namespace: Optional[str] = None, die: bool = True) -> str:
-    """Run kubectl command with error handling"""
+def run_kubectl(*args, namespace: Optional[str] = None, die: bool = True) -> bytes:
+    """Run kubectl command with error handling, returning raw stdout bytes.
+
+    Most callers feed the output straight into a JSON parser that accepts
+    bytes, so skipping the text decode avoids an extra pass over payloads
+    that can reach hundreds of KB. Use run_kubectl_text for the few sites
+    that do string work on the output.
+    """
     kubectl = get_kubectl_binary()
     cmd = [kubectl] + list(args)
-    
+
     if namespace:
         cmd.extend(["-n", namespace])
-    
+
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True
         )
         return result.stdout
@@ -99,76 +148,200 @@ def run_kubectl(*args, namespace: Optional[str] = None, die: bool = True) -> str
         if die:
             console.print(f"❌ [red]kubectl command failed: {e}[/red]")
             if e.stderr:
-                console.print(f"[dim]{e.stderr}[/dim]")
+                console.print(f"[dim]{e.stderr.decode(errors='replace')}[/dim]")
             raise
         else:
             raise
 
+def run_kubectl_text(*args, namespace: Optional[str] = None, die: bool = True) -> str:
+    """run_kubectl variant for callers that parse the output as text"""
+    return run_kubectl(*args, namespace=namespace, die=die).decode(errors='replace')
+
+class KubectlProxy:
+    """Serve the apiserver over local HTTP via one `kubectl proxy` child.
+
+    Polling loops that shell out to kubectl pay a fork/exec plus a fresh
+    TLS handshake per probe. A single `kubectl proxy --port=0` child does
+    the kubeconfig and TLS setup once; probes then become plain HTTP GETs
+    against 127.0.0.1 over a pooled connection. Use as a context manager
+    so the child is always terminated.
+    """
+
+    def __init__(self):
+        self.base: Optional[str] = None
+        self._process = None
+        self._session = None
+
+    def __enter__(self) -> 'KubectlProxy':
+        import requests
+
+        kubectl = get_kubectl_binary()
+        self._process = subprocess.Popen(
+            [kubectl, "proxy", "--port=0"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        # kubectl announces "Starting to serve on 127.0.0.1:<port>"
+        line = self._process.stdout.readline().decode(errors='replace')
+        if "127.0.0.1:" not in line:
+            self.close()
+            raise RuntimeError(f"kubectl proxy did not start: {line.strip() or 'no output'}")
+        port = line.strip().rsplit(":", 1)[1]
+        self.base = f"http://127.0.0.1:{port}"
+        self._session = requests.Session()
+        return self
+
+    def get(self, path: str, timeout: float = 10):
+        """GET a raw apiserver path (e.g. /readyz, /api/v1/nodes)"""
+        return self._session.get(self.base + path, timeout=timeout)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+def _proxy_cluster_ready(proxy: KubectlProxy, with_ready_node: bool = True) -> bool:
+    """is_cluster_ready equivalent issued through a KubectlProxy"""
+    try:
+        if proxy.get("/readyz").text.strip() != "ok":
+            return False
+        if not with_ready_node:
+            return True
+        nodes = _json_loads(proxy.get("/api/v1/nodes").content)
+        for item in nodes.get("items", []):
+            for cond in item.get("status", {}).get("conditions", []):
+                if cond.get("type") == "Ready" and cond.get("status") == "True":
+                    return True
+        return False
+    except Exception:
+        return False
+
 def is_cluster_ready(with_ready_node: bool = True) -> bool:
     """Check if Kubernetes cluster is ready"""
     try:
-        # Check if we can connect to the cluster
-        run_kubectl("cluster-info", die=False)
-        
-        # Check if service/kubernetes exists (API server is up)
-        all_resources = run_kubectl("get", "all", "--all-namespaces", die=False)
-        has_kubernetes_service = "service/kubernetes" in all_resources
-        
-        if not with_ready_node:
-            return has_kubernetes_service
-        
-        # Check if at least one node is ready
-        nodes_output = run_kubectl("get", "nodes", die=False)
-        has_ready_node = " Ready " in nodes_output
-        
-        return has_kubernetes_service and has_ready_node
-        
+        # /readyz answers with a 2-byte "ok" — the old `get all
+        # --all-namespaces` probe pulled every resource in the cluster
+        # just to see whether the apiserver was up
+        apiserver_ready = run_kubectl_text("get", "--raw=/readyz", die=False).strip() == "ok"
+
+        if not with_ready_node or not apiserver_ready:
+            return apiserver_ready
+
+        # One short jsonpath line instead of the full node table
+        ready_conditions = run_kubectl_text(
+            "get", "nodes", "-o",
+            'jsonpath={.items[*].status.conditions[?(@.type=="Ready")].status}',
+            die=False
+        )
+        return "True" in ready_conditions.split()
+
     except Exception:
         return False
 
 def wait_for_cluster_ready(timeout: int = 60, with_ready_node: bool = True) -> bool:
-    """Wait for cluster to be ready with timeout"""
+    """Wait for cluster to be ready with timeout.
+
+    Polls with exponential backoff plus jitter: a healthy cluster is
+    caught within the first fraction of a second, while a recovering one
+    sees probes thin out to ~5s apart instead of a fixed-cadence herd.
+    """
     start_time = time.time()
     end_time = start_time + timeout
-    
-    with console.status("⏳ Waiting for cluster to be ready..."):
-        while time.time() < end_time:
-            if is_cluster_ready(with_ready_node=with_ready_node):
-                return True
-            time.sleep(2)
-    
+
+    base_delay = 0.25
+    max_delay = 5.0
+    attempt = 0
+
+    # One proxy child for the whole wait beats a kubectl fork/exec per
+    # probe; if the proxy won't start, fall back to per-probe kubectl
+    proxy = None
+    try:
+        proxy = KubectlProxy().__enter__()
+    except Exception:
+        proxy = None
+
+    try:
+        with console.status("⏳ Waiting for cluster to be ready..."):
+            while time.time() < end_time:
+                if proxy is not None:
+                    ready = _proxy_cluster_ready(proxy, with_ready_node=with_ready_node)
+                else:
+                    ready = is_cluster_ready(with_ready_node=with_ready_node)
+                if ready:
+                    return True
+                delay = min(max_delay, base_delay * (2 ** attempt))
+                time.sleep(delay * (0.5 + random.random() * 0.5))
+                attempt += 1
+    finally:
+        if proxy is not None:
+            proxy.close()
+
     return False
 
+# Node role labels look like node-role.kubernetes.io/<role>
+_ROLE_PREFIX = "node-role.kubernetes.io/"
+_ROLE_PREFIX_LEN = len(_ROLE_PREFIX)
+
 def get_cluster_info() -> Dict[str, Any]:
     """Get comprehensive cluster information"""
     info = {}
-    
+
     try:
+        # Resolve the binary once for every subprocess below (the probe
+        # itself is cached, this just skips the repeated call overhead)
+        kubectl = get_kubectl_binary()
+
         # Get current context
         context_result = subprocess.run(
-            [get_kubectl_binary(), "config", "current-context"],
+            [kubectl, "config", "current-context"],
             capture_output=True, text=True
         )
         if context_result.returncode == 0:
             info["current_context"] = context_result.stdout.strip()
-        
+
         # Get cluster info
         cluster_result = subprocess.run(
-            [get_kubectl_binary(), "cluster-info"],
+            [kubectl, "cluster-info"],
             capture_output=True, text=True
         )
         if cluster_result.returncode == 0:
             info["cluster_info"] = cluster_result.stdout
         
-        # Get nodes information
-        nodes_result = subprocess.run(
-            [get_kubectl_binary(), "get", "nodes", "-o", "json"],
-            capture_output=True, text=True
-        )
-        if nodes_result.returncode == 0:
-            nodes_data = json.loads(nodes_result.stdout)
+        # Get nodes information - API client first, kubectl fallback
+        nodes_data = None
+        v1 = _get_core_v1_api()
+        if v1 is not None:
+            try:
+                node_list = v1.list_node(_request_timeout=10)
+                nodes_data = {
+                    "items": [
+                        v1.api_client.sanitize_for_serialization(node)
+                        for node in node_list.items
+                    ]
+                }
+            except Exception:
+                nodes_data = None
+
+        if nodes_data is None:
+            nodes_result = subprocess.run(
+                [kubectl, "get", "nodes", "-o", "json"],
+                capture_output=True, text=True
+            )
+            if nodes_result.returncode == 0:
+                nodes_data = _json_loads(nodes_result.stdout)
+
+        if nodes_data is not None:
             info["nodes"] = []
-            
+
             for node in nodes_data.get("items", []):
                 node_info = {
                     "name": node["metadata"]["name"],
@@ -176,7 +349,7 @@ def get_cluster_info() -> Dict[str, Any]:
                     "roles": [],
                     "version": node["status"]["nodeInfo"]["kubeletVersion"]
                 }
-                
+
                 # Get node status
                 conditions = node["status"]["conditions"]
                 ready_condition = next((c for c in conditions if c["type"] == "Ready"), None)
@@ -184,20 +357,21 @@ def get_cluster_info() -> Dict[str, Any]:
                     node_info["status"] = "Ready"
                 else:
                     node_info["status"] = "NotReady"
-                
-                # Get roles
+
+                # Get roles: strip the known prefix instead of re-splitting
+                # each matching label
                 labels = node["metadata"].get("labels", {})
-                for label in labels:
-                    if label.startswith("node-role.kubernetes.io/"):
-                        role = label.split("/")[-1]
-                        if role:
-                            node_info["roles"].append(role)
-                
-                if not node_info["roles"]:
-                    node_info["roles"] = ["worker"]
-                
+                node_info["roles"] = [
+                    label[_ROLE_PREFIX_LEN:]
+                    for label in labels
+                    if label.startswith(_ROLE_PREFIX) and len(label) > _ROLE_PREFIX_LEN
+                ] or ["worker"]
+
+                # Pre-joined for display so row loops don't re-join per render
+                node_info["roles_str"] = ", ".join(node_info["roles"])
+
                 info["nodes"].append(node_info)
-        
+
         return info
         
     except Exception as e:
@@ -206,6 +380,15 @@ def get_cluster_info() -> Dict[str, Any]:
 
 def check_namespace_exists(namespace: str) -> bool:
     """Check if a namespace exists"""
+    v1 = _get_core_v1_api()
+    if v1 is not None:
+        try:
+            v1.read_namespace(namespace, _request_timeout=10)
+            return True
+        except Exception as e:
+            # 404 means a definitive "no"; other errors fall through to kubectl
+            if getattr(e, 'status', None) == 404:
+                return False
     try:
         run_kubectl("get", "namespace", namespace, die=False)
         return True
@@ -228,51 +411,130 @@ def create_namespace_if_not_exists(namespace: str) -> bool:
 def get_pod_status(namespace: str, label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get status of pods in a namespace"""
     try:
-        cmd = ["get", "pods", "-o", "json"]
+        # Prefer the API client (single pooled HTTP call), fall back to kubectl
+        pods_data = None
+        v1 = _get_core_v1_api()
+        if v1 is not None:
+            try:
+                kwargs = {"_request_timeout": 10}
+                if label_selector:
+                    kwargs["label_selector"] = label_selector
+                if namespace != "all":
+                    pod_list = v1.list_namespaced_pod(namespace, **kwargs)
+                else:
+                    pod_list = v1.list_pod_for_all_namespaces(**kwargs)
+                pods_data = {
+                    "items": [
+                        v1.api_client.sanitize_for_serialization(pod)
+                        for pod in pod_list.items
+                    ]
+                }
+            except Exception:
+                pods_data = None
+
+        if pods_data is not None:
+            return [_pod_info(pod) for pod in pods_data.get("items", [])]
+
+        # kubectl fallback: project just the needed fields via
+        # custom-columns, so kubectl ships a few short lines instead of
+        # the full pod objects (~10x fewer bytes, no JSON parse)
+        cmd = ["get", "pods", "-o", _POD_COLUMNS, "--no-headers"]
         if namespace != "all":
             cmd.extend(["-n", namespace])
         else:
             cmd.append("--all-namespaces")
-        
+
         if label_selector:
             cmd.extend(["-l", label_selector])
-        
-        result = run_kubectl(*cmd, die=False)
-        pods_data = json.loads(result)
-        
-        pods = []
-        for pod in pods_data.get("items", []):
-            pod_info = {
-                "name": pod["metadata"]["name"],
-                "namespace": pod["metadata"]["namespace"],
-                "status": pod["status"]["phase"],
-                "ready": "0/0",
-                "restarts": 0,
-                "age": pod["metadata"]["creationTimestamp"]
-            }
-            
-            # Calculate ready containers
-            containers = pod["status"].get("containerStatuses", [])
-            ready_count = sum(1 for c in containers if c.get("ready", False))
-            total_count = len(containers)
-            pod_info["ready"] = f"{ready_count}/{total_count}"
-            
-            # Calculate restarts
-            pod_info["restarts"] = sum(c.get("restartCount", 0) for c in containers)
-            
-            pods.append(pod_info)
-        
-        return pods
-        
+
+        result = run_kubectl_text(*cmd, die=False)
+        return [
+            pod for pod in (_parse_pod_row(line) for line in result.splitlines())
+            if pod is not None
+        ]
+
     except Exception as e:
         console.print(f"❌ [red]Error getting pod status: {e}[/red]")
         return []
 
+# Server-side projection for the kubectl pod listing fallback
+_POD_COLUMNS = (
+    "custom-columns="
+    "NAME:.metadata.name,"
+    "NS:.metadata.namespace,"
+    "PHASE:.status.phase,"
+    "READY:.status.containerStatuses[*].ready,"
+    "RESTARTS:.status.containerStatuses[*].restartCount,"
+    "AGE:.metadata.creationTimestamp"
+)
+
+def _parse_pod_row(line: str):
+    """Parse one custom-columns pod row into the CLI's pod-status shape"""
+    parts = line.split()
+    if len(parts) != 6:
+        return None
+    name, pod_namespace, phase, ready_col, restarts_col, age = parts
+    ready_flags = ready_col.split(',') if ready_col != '<none>' else []
+    restart_counts = restarts_col.split(',') if restarts_col != '<none>' else []
+    return {
+        "name": name,
+        "namespace": pod_namespace,
+        "status": phase,
+        "ready": f"{sum(1 for flag in ready_flags if flag == 'true')}/{len(ready_flags)}",
+        "restarts": sum(int(count) for count in restart_counts),
+        "age": age
+    }
+
+def _pod_info(pod: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize one pod's JSON into the CLI's pod-status shape"""
+    containers = pod["status"].get("containerStatuses", [])
+    ready_count = sum(1 for c in containers if c.get("ready", False))
+    return {
+        "name": pod["metadata"]["name"],
+        "namespace": pod["metadata"]["namespace"],
+        "status": pod["status"]["phase"],
+        "ready": f"{ready_count}/{len(containers)}",
+        "restarts": sum(c.get("restartCount", 0) for c in containers),
+        "age": pod["metadata"]["creationTimestamp"]
+    }
+
+def get_module_resources(namespace: str, module_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch a module's pods, services and endpoints in one kubectl call
+
+    Grouping the three resource kinds into a single `kubectl get` collapses
+    the former pods + services + per-service endpoint lookups (3+N
+    subprocesses) into one apiserver round trip.
+    """
+    grouped = {"Pod": [], "Service": [], "Endpoints": []}
+    result = run_kubectl("get", "pods,services,endpoints",
+                         "-l", f"app={module_name}",
+                         "-o", "json", namespace=namespace, die=False)
+    if result:
+        for item in _json_loads(result).get("items", []):
+            kind = item.get("kind")
+            if kind in grouped:
+                grouped[kind].append(item)
+    return grouped
+
 def get_service_endpoints(namespace: str, service_name: str) -> List[str]:
     """Get endpoints for a service"""
     try:
-        result = run_kubectl("get", "service", service_name, "-o", "json", namespace=namespace)
-        service_data = json.loads(result)
+        # Prefer the API client (single pooled HTTP call), fall back to kubectl
+        service_data = None
+        v1 = _get_core_v1_api()
+        if v1 is not None:
+            try:
+                service = v1.read_namespaced_service(
+                    service_name, namespace, _request_timeout=10
+                )
+                service_data = v1.api_client.sanitize_for_serialization(service)
+            except Exception:
+                service_data = None
+
+        if service_data is None:
+            result = run_kubectl("get", "service", service_name, "-o", "json",
+                                 namespace=namespace)
+            service_data = _json_loads(result)
         
         endpoints = []
         
@@ -318,10 +580,12 @@ def check_module_health(namespace: str, module_name: str) -> Dict[str, Any]:
     }
     
     try:
-        # Get pods for this module
-        pods = get_pod_status(namespace, f"app={module_name}")
+        # One combined query covers pods, services and endpoints
+        resources = get_module_resources(namespace, module_name)
+
+        pods = [_pod_info(pod) for pod in resources["Pod"]]
         health_info["pods"] = pods
-        
+
         # Determine overall status based on pods
         if not pods:
             health_info["status"] = "not_found"
@@ -331,20 +595,23 @@ def check_module_health(namespace: str, module_name: str) -> Dict[str, Any]:
             health_info["status"] = "pending"
         else:
             health_info["status"] = "failed"
-        
-        # Get services
-        services_result = run_kubectl("get", "services", "-l", f"app={module_name}", 
-                                    "-o", "json", namespace=namespace, die=False)
-        if services_result:
-            services_data = json.loads(services_result)
-            for service in services_data.get("items", []):
-                service_name = service["metadata"]["name"]
-                health_info["services"].append(service_name)
-                
-                # Get endpoints for this service
-                endpoints = get_service_endpoints(namespace, service_name)
-                health_info["endpoints"].extend(endpoints)
-        
+
+        health_info["services"] = [
+            service["metadata"]["name"] for service in resources["Service"]
+        ]
+
+        # Read addresses straight off the native Endpoints objects instead
+        # of re-querying each Service
+        for endpoint in resources["Endpoints"]:
+            for subset in endpoint.get("subsets") or []:
+                ports = [p.get("port") for p in subset.get("ports", [])]
+                for address in subset.get("addresses", []):
+                    ip = address.get("ip")
+                    if ip:
+                        health_info["endpoints"].extend(
+                            f"{ip}:{port}" for port in ports
+                        )
+
         return health_info
         
     except Exception as e:
@@ -353,6 +620,26 @@ def check_module_health(namespace: str, module_name: str) -> Dict[str, Any]:
         health_info["error"] = str(e)
         return health_info
 
+def check_modules_health(namespace: str, module_names: List[str],
+                         max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+    """Check several modules' health concurrently.
+
+    Each check is one apiserver round trip, so running them on a small
+    thread pool makes N modules cost roughly one latency instead of N.
+    Returns {module_name: health_info} in no particular order guarantee.
+    """
+    if not module_names:
+        return {}
+    if len(module_names) == 1:
+        name = module_names[0]
+        return {name: check_module_health(namespace, name)}
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(module_names))) as pool:
+        results = pool.map(lambda name: check_module_health(namespace, name),
+                           module_names)
+    return dict(zip(module_names, results))
+
 def validate_kubernetes_access() -> bool:
     """Validate that we have proper Kubernetes access"""
     try:
@@ -18,22 +18,58 @@ Key Features:
 - Automated remediation suggestions
 """
 
+import functools
 import os
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 import yaml
-from rich.console import Console
+from pkg.console import console
+
+# kubectl resource dumps can be large; orjson parses them several times
+# faster than the stdlib, with a silent fallback when not installed
+try:
+    import orjson
+
+    def _loads(data):
+        if isinstance(data, str):
+            data = data.encode()
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+# libyaml-backed parser when compiled in; the pure-Python one otherwise
+# (same output, just slower)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on (path, mtime, size).
+
+    Repeated detections re-read the same Chart.yaml files; keying the
+    cache on the stat result means an edited file is re-parsed while an
+    unchanged one costs a dict lookup.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 from pkg.kubernetes import (
     run_kubectl,
     check_module_health,
+    check_modules_health,
     get_service_endpoints,
     check_namespace_exists
 )
 
-console = Console()
 
 # Module detection patterns - how to identify each module type
 MODULE_PATTERNS = {
@@ -84,21 +120,41 @@ MODULE_PATTERNS = {
     }
 }
 
+# check_status markers split into structured form once at import. Full
+# markers like "statefulset.apps/minio" match on (kind.group, name); a bare
+# kind marker like "deployment.apps/" matches any resource of that kind.
+_STATUS_EXACT: Dict[Any, str] = {}
+_STATUS_KIND_ONLY: Dict[str, List[str]] = {}
+for _name, _pattern in MODULE_PATTERNS.items():
+    _kind_group, _, _resource = _pattern["check_status"].partition("/")
+    if _resource:
+        _STATUS_EXACT[(_kind_group, _resource)] = _name
+    else:
+        _STATUS_KIND_ONLY.setdefault(_kind_group, []).append(_name)
+del _name, _pattern, _kind_group, _resource
+
+# Derived per-module lookups built once at import so hot paths do a dict
+# access instead of rebuilding sets and selector strings per call
+_MODULE_SERVICE_SETS = {name: frozenset(p["services"]) for name, p in MODULE_PATTERNS.items()}
+_MODULE_LABEL_SELECTORS = {name: f"app={name}" for name in MODULE_PATTERNS}
+
 def get_available_modules() -> List[Dict[str, Any]]:
     """Get list of available platform modules from charts directory"""
     available_modules = []
     
-    # Try to find charts directory
-    charts_paths = [
+    # Try to find charts directory — probe with os.path on plain strings
+    # (Path construction is comparatively expensive) and only build a
+    # Path for the candidate that wins
+    charts_paths = (
         os.environ.get("SNAP", "") + "/charts" if os.environ.get("SNAP") else "",
         "../spandaai-platform-deployment/bare-metal/modules",
         "./charts",
         "/opt/spandak8s/charts"
-    ]
-    
+    )
+
     charts_dir = None
     for path in charts_paths:
-        if path and Path(path).exists():
+        if path and os.path.isdir(path):
             charts_dir = Path(path)
             break
     
@@ -130,9 +186,10 @@ def get_available_modules() -> List[Dict[str, Any]]:
                 chart_yaml = item / "Chart.yaml"
                 if chart_yaml.exists():
                     try:
-                        with open(chart_yaml, 'r') as f:
-                            chart_data = yaml.safe_load(f)
-                        
+                        st = chart_yaml.stat()
+                        chart_data = _load_yaml_cached(str(chart_yaml),
+                                                       st.st_mtime_ns, st.st_size)
+
                         module_info.update({
                             "description": chart_data.get("description", module_info["description"]),
                             "version": chart_data.get("version", "latest"),
@@ -149,25 +206,88 @@ def get_available_modules() -> List[Dict[str, Any]]:
     
     return available_modules
 
+# Namespace resource listings are reused for a short window so concurrent
+# detections (e.g. status --all-envs fan-out) and repeated calls within one
+# process hit the kube-apiserver once per namespace instead of once per call.
+_NS_RESOURCES_TTL = 15.0
+_ns_resources_lock = threading.Lock()
+_ns_resources_cache: Dict[str, Any] = {}
+
+def _get_namespace_resources(namespace: str) -> str:
+    """Get the raw resource listing for a namespace, cached with a short TTL"""
+    now = time.monotonic()
+    with _ns_resources_lock:
+        cached = _ns_resources_cache.get(namespace)
+        if cached and now - cached[0] < _NS_RESOURCES_TTL:
+            return cached[1]
+
+    all_resources = run_kubectl("get", "all", "-o", "json", namespace=namespace, die=False)
+
+    with _ns_resources_lock:
+        _ns_resources_cache[namespace] = (now, all_resources)
+    return all_resources
+
+# Namespace existence barely changes within one invocation, so multi-
+# namespace loops reuse the answer for a few seconds instead of paying an
+# API round trip (or kubectl spawn) per detect call.
+_NS_EXISTS_TTL = 5.0
+_ns_exists_cache: Dict[str, Any] = {}
+
+def _namespace_exists_cached(namespace: str) -> bool:
+    """check_namespace_exists with a short per-namespace TTL"""
+    now = time.monotonic()
+    with _ns_resources_lock:
+        cached = _ns_exists_cache.get(namespace)
+        if cached and now - cached[0] < _NS_EXISTS_TTL:
+            return cached[1]
+
+    exists = check_namespace_exists(namespace)
+
+    with _ns_resources_lock:
+        _ns_exists_cache[namespace] = (now, exists)
+    return exists
+
 def detect_running_modules(namespace: str) -> Dict[str, Dict[str, Any]]:
     """Detect which modules are currently running in a namespace"""
-    if not check_namespace_exists(namespace):
+    if not _namespace_exists_cached(namespace):
         return {}
-    
+
     running_modules = {}
-    
+
     try:
-        # Get all resources in the namespace
-        all_resources = run_kubectl("get", "all", "-o", "json", namespace=namespace, die=False)
+        # Get all resources in the namespace (cached across close-together calls)
+        all_resources = _get_namespace_resources(namespace)
         if not all_resources:
             return {}
         
-        resources_data = json.loads(all_resources)
-        all_resources_text = json.dumps(resources_data)
-        
-        # Check each module pattern
-        for module_name, pattern in MODULE_PATTERNS.items():
-            module_info = check_module_in_namespace(module_name, pattern, namespace, all_resources_text)
+        # Walk the parsed items and match kind + name structurally — the
+        # markers only encode those two fields, so there is no need to
+        # materialize the dump as one huge string and substring-scan it
+        found = set()
+        for item in _loads(all_resources).get("items", []):
+            kind_group = "{}.{}".format(item.get("kind", "").lower(),
+                                        item.get("apiVersion", "").split("/")[0])
+            hit = _STATUS_EXACT.get((kind_group, item.get("metadata", {}).get("name", "")))
+            if hit:
+                found.add(hit)
+            found.update(_STATUS_KIND_ONLY.get(kind_group, ()))
+
+        # Fetch health for all detected candidates concurrently instead
+        # of one round trip per module
+        candidates = [
+            (module_name, pattern)
+            for module_name, pattern in MODULE_PATTERNS.items()
+            if module_name in found
+        ]
+        candidate_names = [module_name for module_name, _ in candidates]
+        health_by_name = check_modules_health(namespace, candidate_names)
+        config_resources = _fetch_module_configs(namespace, candidate_names)
+        for module_name, pattern in candidates:
+            module_info = check_module_in_namespace(
+                module_name, pattern, namespace,
+                health_info=health_by_name.get(module_name),
+                config_resources=config_resources.get(module_name)
+            )
             if module_info:
                 running_modules[module_name] = module_info
     
@@ -176,22 +296,33 @@ def detect_running_modules(namespace: str) -> Dict[str, Dict[str, Any]]:
     
     return running_modules
 
-def check_module_in_namespace(module_name: str, pattern: Dict[str, Any], 
-                            namespace: str, all_resources_text: str) -> Optional[Dict[str, Any]]:
-    """Check if a specific module is running in the namespace"""
-    
+def check_module_in_namespace(module_name: str, pattern: Dict[str, Any],
+                            namespace: str,
+                            all_resources_text: Optional[str] = None,
+                            health_info: Optional[Dict[str, Any]] = None,
+                            config_resources: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Check if a specific module is running in the namespace
+
+    Callers that already established presence and fetched health info or
+    config resources (the batched detection fan-out) pass them in;
+    otherwise they are looked up here. all_resources_text, when given,
+    is used as a cheap presence pre-filter.
+    """
+
     # Check if the module's check_status pattern exists in resources
-    if pattern["check_status"] not in all_resources_text:
+    if all_resources_text is not None and pattern["check_status"] not in all_resources_text:
         return None
-    
+
     # Module is detected, get detailed health info
-    health_info = check_module_health(namespace, module_name)
-    
+    if health_info is None:
+        health_info = check_module_health(namespace, module_name)
+
     if health_info["status"] == "not_found":
         return None
-    
+
     # Get additional configuration information
-    module_config = get_module_configuration(module_name, namespace)
+    module_config = get_module_configuration(module_name, namespace,
+                                             resources=config_resources)
     
     return {
         "name": module_name,
@@ -204,69 +335,111 @@ def check_module_in_namespace(module_name: str, pattern: Dict[str, Any],
         "health": health_info
     }
 
-def get_module_configuration(module_name: str, namespace: str) -> Dict[str, Any]:
-    """Extract configuration information for a module"""
+def _fetch_module_configs(namespace: str, module_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch config-bearing resources for several modules in one kubectl call.
+
+    The per-module path cost up to four subprocess spawns each
+    (configmaps + three workload kinds); a single comma-separated query
+    with an `app in (...)` selector covers every candidate at once. Items
+    are grouped per module by their app label and by kind.
+    """
+    grouped: Dict[str, Dict[str, Any]] = {
+        name: {"configmaps": [], "workloads": [], "pvcs": []}
+        for name in module_names
+    }
+    if not module_names:
+        return grouped
+
+    result = run_kubectl(
+        "get", "configmaps,deployments,statefulsets,daemonsets,pvc",
+        "-l", "app in ({})".format(",".join(module_names)),
+        "-o", "json", namespace=namespace, die=False
+    )
+    if not result:
+        return grouped
+
+    for item in _loads(result).get("items", []):
+        labels = item.get("metadata", {}).get("labels") or {}
+        bucket = grouped.get(labels.get("app"))
+        if bucket is None:
+            continue
+        kind = item.get("kind", "")
+        if kind == "ConfigMap":
+            bucket["configmaps"].append(item)
+        elif kind == "PersistentVolumeClaim":
+            bucket["pvcs"].append(item)
+        elif kind in ("Deployment", "StatefulSet", "DaemonSet"):
+            bucket["workloads"].append(item)
+    return grouped
+
+def get_module_configuration(module_name: str, namespace: str,
+                             resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Extract configuration information for a module
+
+    The detection fan-out passes resources pre-fetched by
+    _fetch_module_configs; standalone callers leave resources=None and
+    pay one batched query for just this module.
+    """
     config = {}
-    
+
     try:
-        # Try to get configuration from ConfigMaps
-        configmaps_result = run_kubectl("get", "configmaps", "-l", f"app={module_name}", 
-                                       "-o", "json", namespace=namespace, die=False)
-        if configmaps_result:
-            configmaps_data = json.loads(configmaps_result)
-            for cm in configmaps_data.get("items", []):
-                cm_data = cm.get("data", {})
-                config.update(cm_data)
-        
-        # Try to get resource information from the main deployment/statefulset
-        resource_types = ["deployment", "statefulset", "daemonset"]
-        for resource_type in resource_types:
-            try:
-                resource_result = run_kubectl("get", resource_type, "-l", f"app={module_name}",
-                                            "-o", "json", namespace=namespace, die=False)
-                if resource_result:
-                    resource_data = json.loads(resource_result)
-                    for resource in resource_data.get("items", []):
-                        spec = resource.get("spec", {})
-                        
-                        # Extract replicas
-                        if "replicas" in spec:
-                            config["replicas"] = spec["replicas"]
-                        
-                        # Extract resource requests/limits from containers
-                        template = spec.get("template", {})
-                        containers = template.get("spec", {}).get("containers", [])
-                        for container in containers:
-                            resources = container.get("resources", {})
-                            if resources.get("requests"):
-                                config.update({f"requests_{k}": v for k, v in resources["requests"].items()})
-                            if resources.get("limits"):
-                                config.update({f"limits_{k}": v for k, v in resources["limits"].items()})
-                        
-                        # Extract storage information from volume claims
-                        volume_claims = template.get("spec", {}).get("volumes", [])
-                        for volume in volume_claims:
-                            if "persistentVolumeClaim" in volume:
-                                pvc_name = volume["persistentVolumeClaim"]["claimName"]
-                                # Get PVC details
-                                try:
-                                    pvc_result = run_kubectl("get", "pvc", pvc_name, "-o", "json", 
-                                                           namespace=namespace, die=False)
-                                    if pvc_result:
-                                        pvc_data = json.loads(pvc_result)
-                                        storage_size = pvc_data["spec"]["resources"]["requests"]["storage"]
-                                        config["storage"] = storage_size
-                                except Exception:
-                                    pass
-                        
-                        break  # Only process first resource
-                break
-            except Exception:
-                continue
-    
+        if resources is None:
+            resources = _fetch_module_configs(namespace, [module_name]).get(module_name, {})
+
+        # Configuration from ConfigMaps
+        for cm in resources.get("configmaps", []):
+            config.update(cm.get("data") or {})
+
+        # PVCs from the same batch, so claim lookups below avoid a
+        # kubectl call when the claim carries the module's app label
+        pvcs_by_name = {
+            pvc.get("metadata", {}).get("name"): pvc
+            for pvc in resources.get("pvcs", [])
+        }
+
+        # Resource information from the main deployment/statefulset
+        for resource in resources.get("workloads", [])[:1]:
+            spec = resource.get("spec", {})
+
+            # Extract replicas
+            if "replicas" in spec:
+                config["replicas"] = spec["replicas"]
+
+            # Extract resource requests/limits from containers
+            template = spec.get("template", {})
+            containers = template.get("spec", {}).get("containers", [])
+            for container in containers:
+                requests_limits = container.get("resources", {})
+                if requests_limits.get("requests"):
+                    config.update({f"requests_{k}": v for k, v in requests_limits["requests"].items()})
+                if requests_limits.get("limits"):
+                    config.update({f"limits_{k}": v for k, v in requests_limits["limits"].items()})
+
+            # Extract storage information from volume claims
+            volume_claims = template.get("spec", {}).get("volumes", [])
+            for volume in volume_claims:
+                if "persistentVolumeClaim" in volume:
+                    pvc_name = volume["persistentVolumeClaim"]["claimName"]
+                    pvc_data = pvcs_by_name.get(pvc_name)
+                    if pvc_data is None:
+                        # Claim not labeled with the module's app — fall
+                        # back to a direct lookup
+                        try:
+                            pvc_result = run_kubectl("get", "pvc", pvc_name, "-o", "json",
+                                                   namespace=namespace, die=False)
+                            if pvc_result:
+                                pvc_data = _loads(pvc_result)
+                        except Exception:
+                            pvc_data = None
+                    if pvc_data:
+                        try:
+                            config["storage"] = pvc_data["spec"]["resources"]["requests"]["storage"]
+                        except (KeyError, TypeError):
+                            pass
+
     except Exception as e:
         console.print(f"⚠️ [yellow]Warning: Could not get configuration for {module_name}: {e}[/yellow]")
-    
+
     return config
 
 def get_module_endpoints(module_name: str, namespace: str) -> List[str]:
@@ -274,26 +447,35 @@ def get_module_endpoints(module_name: str, namespace: str) -> List[str]:
     endpoints = []
     
     try:
-        pattern = MODULE_PATTERNS.get(module_name, {})
-        service_names = pattern.get("services", [])
-        
+        # Known service names come from the precomputed frozenset (also
+        # keeps MODULE_PATTERNS immutable — the old list.extend mutated it)
+        known_services = _MODULE_SERVICE_SETS.get(module_name, frozenset())
+
         # Also try to discover services by label
-        services_result = run_kubectl("get", "services", "-l", f"app={module_name}",
+        selector = _MODULE_LABEL_SELECTORS.get(module_name, f"app={module_name}")
+        services_result = run_kubectl("get", "services", "-l", selector,
                                      "-o", "json", namespace=namespace, die=False)
+        discovered_services = []
         if services_result:
-            services_data = json.loads(services_result)
+            services_data = _loads(services_result)
             discovered_services = [svc["metadata"]["name"] for svc in services_data.get("items", [])]
-            service_names.extend(discovered_services)
-        
-        # Remove duplicates
-        service_names = list(set(service_names))
-        
-        for service_name in service_names:
+
+        service_names = list(known_services.union(discovered_services))
+
+        # Each lookup blocks on the API server, so resolve the services
+        # concurrently instead of serially
+        def _endpoints_for(service_name: str) -> List[str]:
             try:
-                service_endpoints = get_service_endpoints(namespace, service_name)
-                endpoints.extend(service_endpoints)
+                return get_service_endpoints(namespace, service_name)
             except Exception:
-                continue
+                return []
+
+        if len(service_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(service_names))) as pool:
+                for service_endpoints in pool.map(_endpoints_for, service_names):
+                    endpoints.extend(service_endpoints)
+        elif service_names:
+            endpoints.extend(_endpoints_for(service_names[0]))
     
     except Exception as e:
         console.print(f"⚠️ [yellow]Warning: Could not get endpoints for {module_name}: {e}[/yellow]")
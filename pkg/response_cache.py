@@ -0,0 +1,113 @@
+"""
+Spandak8s CLI - On-Disk API Response Cache
+
+This module provides a small TTL cache for backend API responses so
+back-to-back CLI invocations (status, tenants list, tenant info) can skip
+the HTTP round trip for data that rarely changes between commands:
+- Entries live under ~/.cache/spandak8s as JSON files
+- Keys are hashed from (endpoint, params) tuples
+- Writes are atomic (temp file + os.replace) so concurrent CLI runs
+  never observe torn entries
+
+Key Features:
+- Per-lookup TTL override for endpoints with different freshness needs
+- Whole-cache or endpoint-prefix invalidation for tenant-changing operations
+- Fail-open behavior: any cache error falls back to the network path
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_CACHE_DIR = "~/.cache/spandak8s"
+DEFAULT_TTL = 300  # seconds
+
+
+class ResponseCache:
+    """File-based TTL cache for JSON-serializable API responses"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = ttl
+
+    def _entry_path(self, key_parts) -> Path:
+        digest = hashlib.blake2b(repr(key_parts).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key_parts, ttl: Optional[int] = None) -> Optional[Any]:
+        """Return the cached value for key_parts, or None if missing/expired"""
+        max_age = self.ttl if ttl is None else ttl
+        entry = self.get_entry(key_parts)
+        if entry is None or time.time() - entry['ts'] > max_age:
+            return None
+        return entry['value']
+
+    def get_entry(self, key_parts) -> Optional[dict]:
+        """Return the raw cache entry (value/ts/etag) regardless of age.
+
+        Used for ETag revalidation, where an expired body is still valid if
+        the server answers 304 Not Modified.
+        """
+        try:
+            with open(self._entry_path(key_parts), 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def set(self, key_parts, value: Any, etag: Optional[str] = None,
+            endpoint: Optional[str] = None) -> None:
+        """Store a value for key_parts (silently skipped on serialization errors)
+
+        endpoint, when given, is recorded in the entry so targeted
+        invalidation can match entries by endpoint prefix (the hashed
+        filenames alone can't be matched against anything).
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry_path = self._entry_path(key_parts)
+            entry = {'ts': time.time(), 'value': value}
+            if etag:
+                entry['etag'] = etag
+            if endpoint:
+                entry['endpoint'] = endpoint
+            # Write to a temp file in the same directory and rename atomically
+            # so concurrent CLI invocations never read a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            pass  # Caching is best-effort; the network path still works
+
+    def invalidate(self, endpoint_prefix: Optional[str] = None) -> None:
+        """Drop cached entries (used after tenant-changing operations)
+
+        With endpoint_prefix, only entries whose recorded endpoint starts
+        with the prefix are removed; entries without a recorded endpoint
+        are dropped too, erring toward freshness. Without a prefix the
+        whole cache is cleared.
+        """
+        try:
+            for entry_path in self.cache_dir.glob('*.json'):
+                if endpoint_prefix is not None:
+                    try:
+                        with open(entry_path, 'r') as f:
+                            endpoint = json.load(f).get('endpoint')
+                        if endpoint and not endpoint.startswith(endpoint_prefix):
+                            continue
+                    except Exception:
+                        pass  # unreadable entry - drop it
+                try:
+                    entry_path.unlink()
+                except OSError:
+                    pass
+        except Exception:
+            pass
@@ -0,0 +1,57 @@
+"""
+Spandak8s CLI - Single-Flight Request Deduplication
+
+This module coalesces concurrent identical read requests so that only one
+underlying call is in flight at a time:
+- First caller with a given key performs the real work
+- Concurrent callers with the same key wait on the same Future and share
+  the result (or the exception)
+- Once the call completes, the key is released and the next call runs fresh
+
+Key Features:
+- Thread-safe via a single lock around the in-flight table
+- Exceptions propagate to every waiting caller
+- No caching: results are shared only between overlapping calls
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Deduplicate concurrent identical calls using a shared Future per key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs), sharing the result with concurrent callers.
+
+        If another call with the same key is already in flight, block until it
+        finishes and return its result instead of issuing a duplicate call.
+        """
+        with self._lock:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                future = existing
+            else:
+                future = Future()
+                self._inflight[key] = future
+
+        if existing is not None:
+            # Another caller is doing the work - wait for its result
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)